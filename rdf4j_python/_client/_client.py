@@ -249,6 +249,29 @@ class AsyncApiClient(BaseClient):
         logger.debug("Response %s: %s bytes", response.status_code, len(response.content))
         return response
 
+    async def head(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """
+        Sends an asynchronous HEAD request.
+
+        Args:
+            path (str): API endpoint path.
+            params (dict[str, Any] | None): Query parameters.
+            headers (dict[str, str] | None): Request headers.
+
+        Returns:
+            httpx.Response: The HTTP response.
+        """
+        url = self._build_url(path)
+        logger.debug("HEAD %s params=%s", url, params)
+        response = await self.client.head(url, params=params, headers=headers)
+        logger.debug("Response %s", response.status_code)
+        return response
+
     async def post(
         self,
         path: str,
@@ -98,6 +98,24 @@ class AsyncRdf4j:
         """
         return AsyncRdf4JRepository(self._client, repository_id)
 
+    async def repository_exists(self, repository_id: str) -> bool:
+        """Checks whether a repository exists without listing all repositories.
+
+        Args:
+            repository_id (str): The ID of the repository.
+
+        Returns:
+            bool: True if the server knows the repository, False otherwise.
+
+        Raises:
+            httpx.HTTPStatusError: If the server responds with an unexpected error.
+        """
+        response = await self._client.head(f"/repositories/{repository_id}")
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return False
+        response.raise_for_status()
+        return True
+
     async def create_repository(
         self,
         config: RepositoryConfig,
@@ -1,6 +1,8 @@
+import asyncio
 import re
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Iterable, Optional, Union
+from typing import Optional, Union
 
 import httpx
 import pyoxigraph as og
@@ -36,63 +38,25 @@ except ImportError:
     _has_sparql_wrapper = False
 
 
-# Pattern to match PREFIX declarations (handles URIs with # fragments)
-_PREFIX_PATTERN = re.compile(r"PREFIX\s+\w*:\s*<[^>]*>", re.IGNORECASE)
-# Pattern to match BASE declarations
-_BASE_PATTERN = re.compile(r"BASE\s*<[^>]*>", re.IGNORECASE)
-
-
-def _remove_sparql_comments(query: str) -> str:
-    """Removes SPARQL comments while preserving # inside URIs and strings.
-
-    Args:
-        query (str): The SPARQL query string.
-
-    Returns:
-        str: The query with comments removed.
-    """
-    result = []
-    i = 0
-    in_uri = False
-    in_string = False
-    string_char = None
-
-    while i < len(query):
-        char = query[i]
-
-        if in_string:
-            result.append(char)
-            if char == string_char and (i == 0 or query[i - 1] != "\\"):
-                in_string = False
-            i += 1
-        elif in_uri:
-            result.append(char)
-            if char == ">":
-                in_uri = False
-            i += 1
-        elif char == "<":
-            in_uri = True
-            result.append(char)
-            i += 1
-        elif char in ('"', "'"):
-            in_string = True
-            string_char = char
-            result.append(char)
-            i += 1
-        elif char == "#":
-            # Skip until end of line
-            while i < len(query) and query[i] != "\n":
-                i += 1
-        else:
-            result.append(char)
-            i += 1
-
-    return "".join(result)
+# Matches the query prologue: whitespace, comments, and PREFIX/BASE declarations
+# Whitespace and comments may also appear between the tokens of a declaration.
+# The repetitions are possessive so that a failed declaration cannot backtrack
+# into re-splitting a run of "#" into comments, which would take exponential time.
+_SEPARATOR = r"(?:\s|#[^\n]*)"
+_PROLOGUE_PATTERN = re.compile(
+    rf"(?:\s+|#[^\n]*|PREFIX{_SEPARATOR}++\w*:{_SEPARATOR}*+<[^>]*>"
+    rf"|BASE{_SEPARATOR}*+<[^>]*>)*+",
+    re.IGNORECASE,
+)
+# Matches the query form keyword after the prologue
+_KEYWORD_PATTERN = re.compile(r"[A-Za-z]+")
 
 
 def _detect_query_type(query: str) -> str:
     """Detects the SPARQL query type, ignoring prefixes, base, and comments.
 
+    Only the prologue is scanned, so the cost does not grow with the query body.
+
     Args:
         query (str): The SPARQL query string.
 
@@ -100,18 +64,11 @@ def _detect_query_type(query: str) -> str:
         str: The query type in uppercase (SELECT, ASK, CONSTRUCT, DESCRIBE, INSERT, DELETE, etc.)
              or empty string if unable to determine.
     """
-    # Remove comments (preserving # inside URIs)
-    cleaned = _remove_sparql_comments(query)
-    # Remove all PREFIX declarations
-    cleaned = _PREFIX_PATTERN.sub("", cleaned)
-    # Remove all BASE declarations
-    cleaned = _BASE_PATTERN.sub("", cleaned)
-    # Get the first word
-    cleaned = cleaned.strip()
-    if not cleaned:
+    prologue = _PROLOGUE_PATTERN.match(query)
+    keyword = _KEYWORD_PATTERN.match(query, prologue.end() if prologue else 0)
+    if not keyword:
         return ""
-    first_word = cleaned.split()[0].upper()
-    return first_word
+    return keyword.group().upper()
 
 
 class AsyncRdf4JRepository:
@@ -273,6 +230,26 @@ class AsyncRdf4JRepository:
         if response.status_code != httpx.codes.NO_CONTENT:
             raise NamespaceException(f"Failed to set namespace: {response.text}")
 
+    async def set_namespaces(self, namespaces: Mapping[str, IRI]) -> None:
+        """Sets several namespace prefixes concurrently.
+
+        RDF4J has no bulk namespace endpoint, so one request is sent per
+        prefix, all in flight at the same time.
+
+        Args:
+            namespaces (Mapping[str, IRI]): Namespace URIs keyed by prefix.
+
+        Raises:
+            RepositoryNotFoundException: If the repository doesn't exist.
+            NamespaceException: If any of the requests fails.
+        """
+        await asyncio.gather(
+            *(
+                self.set_namespace(prefix, namespace)
+                for prefix, namespace in namespaces.items()
+            )
+        )
+
     async def get_namespace(self, prefix: str) -> Namespace:
         """Gets a namespace by its prefix.
 
@@ -1,8 +1,16 @@
+from functools import lru_cache
+
 import pyoxigraph as og
 
 from rdf4j_python.model.term import IRI
 
 
+@lru_cache(maxsize=4096)
+def _make_iri(namespace: str, name: str) -> IRI:
+    """Builds the IRI for a namespace term; repeated lookups reuse the node."""
+    return IRI(namespace + name)
+
+
 class _Namespace(str):
     def __new__(cls, value: str | bytes) -> "Namespace":
         try:
@@ -12,7 +20,7 @@ class _Namespace(str):
         return rt
 
     def term(self, name: str) -> IRI:
-        return IRI(self + (name if isinstance(name, str) else ""))
+        return _make_iri(self, name if isinstance(name, str) else "")
 
     def __getitem__(self, key: str) -> IRI:
         return self.term(key)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Union
 
 import pyoxigraph as og
@@ -19,6 +20,17 @@ def serialize_term(term: Term) -> str:
     """
     if isinstance(term, str):
         return term
+    # Checked before the cached call, which would reject unhashable input itself.
+    if not isinstance(term, (og.NamedNode, og.Variable, og.Literal, og.BlankNode)):
+        raise TypeError(f"Unsupported term type: {type(term)}")
+    return _serialize_rdf_term(term)
+
+
+@lru_cache(maxsize=4096)
+def _serialize_rdf_term(
+    term: og.NamedNode | og.Variable | og.Literal | og.BlankNode,
+) -> str:
+    """Format a typed term checked by serialize_term. Results are cached."""
     if isinstance(term, og.NamedNode):
         return f"<{term.value}>"
     if isinstance(term, og.Variable):
@@ -30,6 +42,4 @@ def serialize_term(term: Term) -> str:
         if term.datatype and term.datatype.value != _XSD_STRING:
             return f'"{value}"^^<{term.datatype.value}>'
         return f'"{value}"'
-    if isinstance(term, og.BlankNode):
-        return f"_:{term.value}"
-    raise TypeError(f"Unsupported term type: {type(term)}")
+    return f"_:{term.value}"
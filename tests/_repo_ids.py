@@ -0,0 +1,14 @@
+import itertools
+import os
+
+_PID = os.getpid()
+_ID_SEQ = itertools.count()
+
+
+def unique_repo_id(prefix: str = "test_repo") -> str:
+    """Generates a repository ID that is unique across test processes.
+
+    IDs combine the process id with a counter, so a repository left behind by
+    an earlier run that crashed does not clash with the ones created now.
+    """
+    return f"{prefix}_{_PID}_{next(_ID_SEQ)}"
@@ -1,7 +1,9 @@
+import asyncio
 import json
 import logging
+from collections.abc import Callable, Iterable
 from random import randint
-from typing import Any, Iterable, cast
+from typing import Any, cast
 
 import httpx
 import pyoxigraph as og
@@ -15,9 +17,25 @@ from rdf4j_python.model.repository_config import (
     SailRepositoryConfig,
 )
 
+try:
+    import uvloop
+
+    _has_uvloop = True
+except ImportError:
+    _has_uvloop = False
+
 LOGGER = logging.getLogger(__name__)
 
 
+if _has_uvloop:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Runs async tests on uvloop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
 def is_responsive(url: str) -> bool:
     try:
         LOGGER.info(f"awaiting for docker {url} to be responsive....")
@@ -32,6 +50,9 @@ def is_responsive(url: str) -> bool:
 
 @pytest.fixture(scope="session")
 def rdf4j_service(docker_ip: str, docker_services) -> str:
+    # docker-compose.yml publishes 8080 on an ephemeral host port, so each
+    # pytest-xdist worker gets its own server and tests that count
+    # repositories do not see each other's.
     port = docker_services.port_for("rdf4j", 8080)
     url = f"http://{docker_ip}:{port}/rdf4j-server"
     docker_services.wait_until_responsive(
@@ -40,16 +61,31 @@ def rdf4j_service(docker_ip: str, docker_services) -> str:
     return url
 
 
-@pytest_asyncio.fixture(scope="function")
-async def mem_repo(rdf4j_service: str, random_mem_repo_config: RepositoryConfig):
-    """Fixture that yields a ready-to-use memory repository instance."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def rdf4j_db(rdf4j_service: str):
+    """Fixture that yields a client shared by every test in the session.
+
+    Tests using it must run on the session event loop, e.g. with
+    ``pytest.mark.asyncio(loop_scope="session")``.
+    """
 
     async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.create_repository(
-            config=random_mem_repo_config,
-        )
-        yield repo
-        await db.delete_repository(random_mem_repo_config.repo_id)
+        yield db
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def mem_repo(rdf4j_db: AsyncRdf4j, random_mem_repo_config: RepositoryConfig):
+    """Fixture that yields a ready-to-use memory repository instance.
+
+    The repository is served through ``rdf4j_db``, so tests using it must run
+    on the session event loop as well.
+    """
+
+    repo = await rdf4j_db.create_repository(
+        config=random_mem_repo_config,
+    )
+    yield repo
+    await rdf4j_db.delete_repository(random_mem_repo_config.repo_id)
 
 
 @pytest.fixture(scope="function")
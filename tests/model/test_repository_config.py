@@ -1,5 +1,7 @@
-# Helper function to parse Turtle and compare graphs
+from collections.abc import Callable
+
 import pyoxigraph as og
+import pytest
 
 from rdf4j_python.model.repository_config import (
     DatasetRepositoryConfig,
@@ -14,462 +16,514 @@ from rdf4j_python.model.repository_config import (
     SHACLSailConfig,
     SPARQLRepositoryConfig,
 )
+from tests.model._rdf_helpers import canonical_digest, graph_digest
 
+# Prefixes used by the expected Turtle bodies below, which omit them.
+_PREFIXES = b"""
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix config: <tag:rdf4j.org,2023:config/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+"""
 
-def assert_isomorphic(turtle1: bytes | None, turtle2: bytes | None):
-    """
-    Parses two Turtle strings and asserts that the resulting RDF graphs are isomorphic.
-    """
-    parser_1 = og.parse(turtle1, format=og.RdfFormat.TURTLE)
-    parser_2 = og.parse(turtle2, format=og.RdfFormat.TURTLE)
-    graph1 = og.Dataset(parser_1)
-    graph2 = og.Dataset(parser_2)
-    graph1.canonicalize(og.CanonicalizationAlgorithm.UNSTABLE)
-    graph2.canonicalize(og.CanonicalizationAlgorithm.UNSTABLE)
-
-    assert graph1 == graph2
 
+def _expected_digests(cases: dict[str, bytes]) -> dict[str, bytes]:
+    """
+    Returns the canonical digest of every expected Turtle body.
 
-class TestRepositoryConfig:
-    def test_minimal_config(self):
-        config = RepositoryConfig(repo_id="test_repo")
-        expected_turtle = """
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            [] a config:Repository ;
-                config:rep.id "test_repo" .
-        """
-        assert_isomorphic(config.to_turtle(), expected_turtle.encode())
-
-    def test_full_config(self):
-        memory_store_config = MemoryStoreConfig(
-            persist=True,
-            sync_delay=1000,
-            iteration_cache_sync_threshold=5000,
-            default_query_evaluation_mode="STANDARD",
-        )
-        sail_repo_config = SailRepositoryConfig(sail_impl=memory_store_config)
-        config = RepositoryConfig(
-            repo_id="full_test_repo",
-            title="Full Test Repository",
-            impl=sail_repo_config,
-        )
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "full_test_repo" ;
-                rdfs:label "Full Test Repository" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:MemoryStore" ;
-                        config:mem.persist "true"^^xsd:boolean ;
-                        config:mem.syncDelay "1000"^^xsd:integer ;
-                        config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
-                        config:sail.defaultQueryEvaluationMode "STANDARD"
-                    ]
-                ] .
-        """
-        assert_isomorphic(config.to_turtle(), expected_turtle.encode())
-
-    def test_sparql_repo_config(self):
-        sparql_config = SPARQLRepositoryConfig(
-            query_endpoint="http://example.com/sparql",
-            update_endpoint="http://example.com/sparql/update",
-        )
-        repo_config = RepositoryConfig(repo_id="sparql_repo", impl=sparql_config)
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "sparql_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SPARQLRepository" ;
-                    config:sparql.queryEndpoint "http://example.com/sparql" ;
-                    config:sparql.updateEndpoint "http://example.com/sparql/update"
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_http_repo_config(self):
-        http_config = HTTPRepositoryConfig(
-            url="http://example.com/rdf4j", username="user1", password="pass2"
-        )
-        repo_config = RepositoryConfig(repo_id="http_repo", impl=http_config)
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "http_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:HTTPRepository" ;
-                    config:http.url "http://example.com/rdf4j" ;
-                    config:http.username "user1" ;
-                    config:http.password "pass2"
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_dataset_repo_config(self):
-        memory_store_config = MemoryStoreConfig(persist=False)
-        sail_repo_config = SailRepositoryConfig(sail_impl=memory_store_config)
-        dataset_config = DatasetRepositoryConfig(delegate=sail_repo_config)
-        repo_config = RepositoryConfig(repo_id="dataset_repo", impl=dataset_config)
-
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "dataset_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:DatasetRepository" ;
-                    config:delegate [
-                        config:rep.type "openrdf:SailRepository" ;
-                        config:sail.impl [
-                            config:sail.type "openrdf:MemoryStore" ;
-                            config:mem.persist "false"^^xsd:boolean
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_native_store_config(self):
-        native_config = NativeStoreConfig(
-            triple_indexes="spoc,posc",
-            force_sync=True,
-            value_cache_size=10000,
-            value_id_cache_size=5000,
-            namespace_cache_size=200,
-            namespace_id_cache_size=100,
-            iteration_cache_sync_threshold=20000,
-            default_query_evaluation_mode="STANDARD",
-        )
-        repo_config = RepositoryConfig(
-            repo_id="native_repo", impl=SailRepositoryConfig(sail_impl=native_config)
-        )
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "native_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:NativeStore" ;
-                        config:native.tripleIndexes "spoc,posc" ;
-                        config:native.forceSync "true"^^xsd:boolean ;
-                        config:native.valueCacheSize "10000"^^xsd:integer ;
-                        config:native.valueIDCacheSize "5000"^^xsd:integer ;
-                        config:native.namespaceCacheSize "200"^^xsd:integer ;
-                        config:native.namespaceIDCacheSize "100"^^xsd:integer;
-                        config:sail.iterationCacheSyncThreshold "20000"^^xsd:integer;
-                        config:sail.defaultQueryEvaluationMode "STANDARD"
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_elasticsearch_store_config(self):
-        es_config = ElasticsearchStoreConfig(
-            hostname="localhost",
-            port=9200,
-            cluster_name="mycluster",
-            index="myindex",
-            iteration_cache_sync_threshold=10000,
-            default_query_evaluation_mode="STANDARD",
-        )
-        repo_config = RepositoryConfig(
-            repo_id="es_repo", impl=SailRepositoryConfig(sail_impl=es_config)
-        )
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "es_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "rdf4j:ElasticsearchStore" ;
-                        config:ess.hostname "localhost" ;
-                        config:ess.port "9200"^^xsd:integer ;
-                        config:ess.clusterName "mycluster" ;
-                        config:ess.index "myindex";
-                        config:sail.iterationCacheSyncThreshold "10000"^^xsd:integer;
-                        config:sail.defaultQueryEvaluationMode "STANDARD"
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_memory_store_config_defaults(self):
-        config = RepositoryConfig(
-            repo_id="memory_store_repo",
-            impl=SailRepositoryConfig(
-                sail_impl=MemoryStoreConfig(
-                    persist=False,
-                    sync_delay=1000,
-                    iteration_cache_sync_threshold=5000,
-                    default_query_evaluation_mode="STANDARD",
+    All bodies are wrapped into named graphs of one TriG document so the
+    parser runs a single time, then each graph is split back out into the
+    default graph before canonicalization.
+    """
+    trig = _PREFIXES + b"".join(
+        b"<urn:case:%s> {\n%s\n}\n" % (case.encode(), turtle)
+        for case, turtle in cases.items()
+    )
+    dataset = og.Dataset(og.parse(trig, format=og.RdfFormat.TRIG))
+    return {
+        case: graph_digest(
+            og.Dataset(
+                og.Quad(quad.subject, quad.predicate, quad.object)
+                for quad in dataset.quads_for_graph_name(
+                    og.NamedNode(f"urn:case:{case}")
                 )
-            ),
-        )
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "memory_store_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:MemoryStore" ;
-                        config:mem.persist "false"^^xsd:boolean ;
-                        config:mem.syncDelay "1000"^^xsd:integer ;
-                        config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
-                        config:sail.defaultQueryEvaluationMode "STANDARD"
-                    ]
-                ] .
-        """
-        assert_isomorphic(config.to_turtle(), expected_turtle.encode())
-
-    def test_repository_config_with_sail_repository_impl(self):
-        """Test RepositoryConfig with SailRepositoryConfig implementation."""
-        memory_config = MemoryStoreConfig(persist=True)
-        repo_config = RepositoryConfig(
-            repo_id="convenience_repo",
-            title="Convenience Repository",
-            impl=SailRepositoryConfig(sail_impl=memory_config),
+            )
         )
+        for case in cases
+    }
 
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "convenience_repo" ;
-                rdfs:label "Convenience Repository" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:MemoryStore" ;
-                        config:mem.persist "true"^^xsd:boolean
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_schema_caching_rdfs_inferencer_config(self):
-        """Test SchemaCachingRDFSInferencerConfig configuration."""
-        memory_config = MemoryStoreConfig(persist=False)
-        rdfs_config = SchemaCachingRDFSInferencerConfig(
-            delegate=memory_config,
-            iteration_cache_sync_threshold=10000,
-            default_query_evaluation_mode="STANDARD",
-        )
-        repo_config = RepositoryConfig(
-            repo_id="rdfs_repo", impl=SailRepositoryConfig(sail_impl=rdfs_config)
-        )
-
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "rdfs_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "rdf4j:SchemaCachingRDFSInferencer" ;
-                        config:sail.iterationCacheSyncThreshold "10000"^^xsd:integer ;
-                        config:sail.defaultQueryEvaluationMode "STANDARD" ;
-                        config:delegate [
-                            config:sail.type "openrdf:MemoryStore" ;
-                            config:mem.persist "false"^^xsd:boolean
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_direct_type_hierarchy_inferencer_config(self):
-        """Test DirectTypeHierarchyInferencerConfig configuration."""
-        native_config = NativeStoreConfig(triple_indexes="spoc")
-        hierarchy_config = DirectTypeHierarchyInferencerConfig(
-            delegate=native_config,
-            iteration_cache_sync_threshold=5000,
-            default_query_evaluation_mode="STRICT",
-        )
-        repo_config = RepositoryConfig(
-            repo_id="hierarchy_repo",
-            impl=SailRepositoryConfig(sail_impl=hierarchy_config),
-        )
 
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "hierarchy_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:DirectTypeHierarchyInferencer" ;
-                        config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
-                        config:sail.defaultQueryEvaluationMode "STRICT" ;
-                        config:delegate [
-                            config:sail.type "openrdf:NativeStore" ;
-                            config:native.tripleIndexes "spoc"
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_shacl_sail_config(self):
-        """Test SHACLSailConfig configuration with various parameters."""
-        memory_config = MemoryStoreConfig(persist=True)
-        shacl_config = SHACLSailConfig(
-            delegate=memory_config,
-            parallel_validation=True,
-            undefined_target_validates_all_subjects=False,
-            log_validation_plans=True,
-            log_validation_violations=False,
-            ignore_no_shapes_loaded_exception=True,
-            validation_enabled=True,
-            cache_select_nodes=False,
-            global_log_validation_execution=True,
-            rdfs_sub_class_reasoning=False,
-            performance_logging=True,
-            serializable_validation=False,
-            eclipse_rdf4j_shacl_extensions=True,
-            dash_data_shapes=False,
-            validation_results_limit_total=1000,
-            validation_results_limit_per_constraint=100,
-            iteration_cache_sync_threshold=15000,
-            default_query_evaluation_mode="STANDARD",
-        )
-        repo_config = RepositoryConfig(
-            repo_id="shacl_repo", impl=SailRepositoryConfig(sail_impl=shacl_config)
-        )
+def assert_matches_expected(actual_turtle: bytes | None, case: str):
+    """
+    Asserts that a serialized configuration is isomorphic to the expected
+    Turtle of the given case.
 
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "shacl_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "rdf4j:ShaclSail" ;
-                        config:sail.iterationCacheSyncThreshold "15000"^^xsd:integer ;
-                        config:sail.defaultQueryEvaluationMode "STANDARD" ;
-                        config:shacl.parallelValidation "true"^^xsd:boolean ;
-                        config:shacl.undefinedTargetValidatesAllSubjects "false"^^xsd:boolean ;
-                        config:shacl.logValidationPlans "true"^^xsd:boolean ;
-                        config:shacl.logValidationViolations "false"^^xsd:boolean ;
-                        config:shacl.ignoreNoShapesLoadedException "true"^^xsd:boolean ;
-                        config:shacl.validationEnabled "true"^^xsd:boolean ;
-                        config:shacl.cacheSelectNodes "false"^^xsd:boolean ;
-                        config:shacl.globalLogValidationExecution "true"^^xsd:boolean ;
-                        config:shacl.rdfsSubClassReasoning "false"^^xsd:boolean ;
-                        config:shacl.performanceLogging "true"^^xsd:boolean ;
-                        config:shacl.serializableValidation "false"^^xsd:boolean ;
-                        config:shacl.eclipseRdf4jShaclExtensions "true"^^xsd:boolean ;
-                        config:shacl.dashDataShapes "false"^^xsd:boolean ;
-                        config:shacl.validationResultsLimitTotal "1000"^^xsd:integer ;
-                        config:shacl.validationResultsLimitPerConstraint "100"^^xsd:integer ;
-                        config:delegate [
-                            config:sail.type "openrdf:MemoryStore" ;
-                            config:mem.persist "true"^^xsd:boolean
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_shacl_sail_config_minimal(self):
-        """Test SHACLSailConfig with minimal configuration."""
-        memory_config = MemoryStoreConfig(persist=False)
-        shacl_config = SHACLSailConfig(delegate=memory_config)
-        repo_config = RepositoryConfig(
-            repo_id="shacl_minimal_repo",
-            impl=SailRepositoryConfig(sail_impl=shacl_config),
-        )
+    Only the actual Turtle is parsed and canonicalized; the expected digest
+    is precomputed at import time.
+    """
+    assert actual_turtle is not None
+    _, expected_turtle = CASES[case]
+    assert canonical_digest(actual_turtle) == _EXPECTED_DIGESTS[case], (
+        "Graphs are not isomorphic:\n"
+        f"{actual_turtle.decode()}\n---\n{expected_turtle.decode()}"
+    )
+
+
+def _minimal_config() -> RepositoryConfig:
+    return RepositoryConfig(repo_id="test_repo")
+
+
+_MINIMAL_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "test_repo" .
+"""
+
+
+def _full_config() -> RepositoryConfig:
+    memory_store_config = MemoryStoreConfig(
+        persist=True,
+        sync_delay=1000,
+        iteration_cache_sync_threshold=5000,
+        default_query_evaluation_mode="STANDARD",
+    )
+    sail_repo_config = SailRepositoryConfig(sail_impl=memory_store_config)
+    return RepositoryConfig(
+        repo_id="full_test_repo",
+        title="Full Test Repository",
+        impl=sail_repo_config,
+    )
+
+
+_FULL_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "full_test_repo" ;
+    rdfs:label "Full Test Repository" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:MemoryStore" ;
+            config:mem.persist "true"^^xsd:boolean ;
+            config:mem.syncDelay "1000"^^xsd:integer ;
+            config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
+            config:sail.defaultQueryEvaluationMode "STANDARD"
+        ]
+    ] .
+"""
+
+
+def _sparql_repo_config() -> RepositoryConfig:
+    sparql_config = SPARQLRepositoryConfig(
+        query_endpoint="http://example.com/sparql",
+        update_endpoint="http://example.com/sparql/update",
+    )
+    return RepositoryConfig(repo_id="sparql_repo", impl=sparql_config)
+
+
+_SPARQL_REPO_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "sparql_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SPARQLRepository" ;
+        config:sparql.queryEndpoint "http://example.com/sparql" ;
+        config:sparql.updateEndpoint "http://example.com/sparql/update"
+    ] .
+"""
+
+
+def _http_repo_config() -> RepositoryConfig:
+    http_config = HTTPRepositoryConfig(
+        url="http://example.com/rdf4j", username="user1", password="pass2"
+    )
+    return RepositoryConfig(repo_id="http_repo", impl=http_config)
+
+
+_HTTP_REPO_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "http_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:HTTPRepository" ;
+        config:http.url "http://example.com/rdf4j" ;
+        config:http.username "user1" ;
+        config:http.password "pass2"
+    ] .
+"""
+
+
+def _dataset_repo_config() -> RepositoryConfig:
+    memory_store_config = MemoryStoreConfig(persist=False)
+    sail_repo_config = SailRepositoryConfig(sail_impl=memory_store_config)
+    dataset_config = DatasetRepositoryConfig(delegate=sail_repo_config)
+    return RepositoryConfig(repo_id="dataset_repo", impl=dataset_config)
+
+
+_DATASET_REPO_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "dataset_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:DatasetRepository" ;
+        config:delegate [
+            config:rep.type "openrdf:SailRepository" ;
+            config:sail.impl [
+                config:sail.type "openrdf:MemoryStore" ;
+                config:mem.persist "false"^^xsd:boolean
+            ]
+        ]
+    ] .
+"""
+
+
+def _native_store_config() -> RepositoryConfig:
+    native_config = NativeStoreConfig(
+        triple_indexes="spoc,posc",
+        force_sync=True,
+        value_cache_size=10000,
+        value_id_cache_size=5000,
+        namespace_cache_size=200,
+        namespace_id_cache_size=100,
+        iteration_cache_sync_threshold=20000,
+        default_query_evaluation_mode="STANDARD",
+    )
+    return RepositoryConfig(
+        repo_id="native_repo", impl=SailRepositoryConfig(sail_impl=native_config)
+    )
+
+
+_NATIVE_STORE_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "native_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:NativeStore" ;
+            config:native.tripleIndexes "spoc,posc" ;
+            config:native.forceSync "true"^^xsd:boolean ;
+            config:native.valueCacheSize "10000"^^xsd:integer ;
+            config:native.valueIDCacheSize "5000"^^xsd:integer ;
+            config:native.namespaceCacheSize "200"^^xsd:integer ;
+            config:native.namespaceIDCacheSize "100"^^xsd:integer;
+            config:sail.iterationCacheSyncThreshold "20000"^^xsd:integer;
+            config:sail.defaultQueryEvaluationMode "STANDARD"
+        ]
+    ] .
+"""
+
+
+def _elasticsearch_store_config() -> RepositoryConfig:
+    es_config = ElasticsearchStoreConfig(
+        hostname="localhost",
+        port=9200,
+        cluster_name="mycluster",
+        index="myindex",
+        iteration_cache_sync_threshold=10000,
+        default_query_evaluation_mode="STANDARD",
+    )
+    return RepositoryConfig(
+        repo_id="es_repo", impl=SailRepositoryConfig(sail_impl=es_config)
+    )
+
+
+_ELASTICSEARCH_STORE_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "es_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "rdf4j:ElasticsearchStore" ;
+            config:ess.hostname "localhost" ;
+            config:ess.port "9200"^^xsd:integer ;
+            config:ess.clusterName "mycluster" ;
+            config:ess.index "myindex";
+            config:sail.iterationCacheSyncThreshold "10000"^^xsd:integer;
+            config:sail.defaultQueryEvaluationMode "STANDARD"
+        ]
+    ] .
+"""
+
+
+def _memory_store_config_defaults() -> RepositoryConfig:
+    return RepositoryConfig(
+        repo_id="memory_store_repo",
+        impl=SailRepositoryConfig(
+            sail_impl=MemoryStoreConfig(
+                persist=False,
+                sync_delay=1000,
+                iteration_cache_sync_threshold=5000,
+                default_query_evaluation_mode="STANDARD",
+            )
+        ),
+    )
+
+
+_MEMORY_STORE_CONFIG_DEFAULTS_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "memory_store_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:MemoryStore" ;
+            config:mem.persist "false"^^xsd:boolean ;
+            config:mem.syncDelay "1000"^^xsd:integer ;
+            config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
+            config:sail.defaultQueryEvaluationMode "STANDARD"
+        ]
+    ] .
+"""
+
+
+def _repository_config_with_sail_repository_impl() -> RepositoryConfig:
+    """RepositoryConfig with SailRepositoryConfig implementation."""
+    memory_config = MemoryStoreConfig(persist=True)
+    return RepositoryConfig(
+        repo_id="convenience_repo",
+        title="Convenience Repository",
+        impl=SailRepositoryConfig(sail_impl=memory_config),
+    )
+
+
+_REPOSITORY_CONFIG_WITH_SAIL_REPOSITORY_IMPL_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "convenience_repo" ;
+    rdfs:label "Convenience Repository" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:MemoryStore" ;
+            config:mem.persist "true"^^xsd:boolean
+        ]
+    ] .
+"""
+
+
+def _schema_caching_rdfs_inferencer_config() -> RepositoryConfig:
+    """SchemaCachingRDFSInferencerConfig configuration."""
+    memory_config = MemoryStoreConfig(persist=False)
+    rdfs_config = SchemaCachingRDFSInferencerConfig(
+        delegate=memory_config,
+        iteration_cache_sync_threshold=10000,
+        default_query_evaluation_mode="STANDARD",
+    )
+    return RepositoryConfig(
+        repo_id="rdfs_repo", impl=SailRepositoryConfig(sail_impl=rdfs_config)
+    )
+
+
+_SCHEMA_CACHING_RDFS_INFERENCER_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "rdfs_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "rdf4j:SchemaCachingRDFSInferencer" ;
+            config:sail.iterationCacheSyncThreshold "10000"^^xsd:integer ;
+            config:sail.defaultQueryEvaluationMode "STANDARD" ;
+            config:delegate [
+                config:sail.type "openrdf:MemoryStore" ;
+                config:mem.persist "false"^^xsd:boolean
+            ]
+        ]
+    ] .
+"""
+
+
+def _direct_type_hierarchy_inferencer_config() -> RepositoryConfig:
+    """DirectTypeHierarchyInferencerConfig configuration."""
+    native_config = NativeStoreConfig(triple_indexes="spoc")
+    hierarchy_config = DirectTypeHierarchyInferencerConfig(
+        delegate=native_config,
+        iteration_cache_sync_threshold=5000,
+        default_query_evaluation_mode="STRICT",
+    )
+    return RepositoryConfig(
+        repo_id="hierarchy_repo",
+        impl=SailRepositoryConfig(sail_impl=hierarchy_config),
+    )
+
+
+_DIRECT_TYPE_HIERARCHY_INFERENCER_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "hierarchy_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:DirectTypeHierarchyInferencer" ;
+            config:sail.iterationCacheSyncThreshold "5000"^^xsd:integer ;
+            config:sail.defaultQueryEvaluationMode "STRICT" ;
+            config:delegate [
+                config:sail.type "openrdf:NativeStore" ;
+                config:native.tripleIndexes "spoc"
+            ]
+        ]
+    ] .
+"""
+
+
+def _shacl_sail_config() -> RepositoryConfig:
+    """SHACLSailConfig configuration with various parameters."""
+    memory_config = MemoryStoreConfig(persist=True)
+    shacl_config = SHACLSailConfig(
+        delegate=memory_config,
+        parallel_validation=True,
+        undefined_target_validates_all_subjects=False,
+        log_validation_plans=True,
+        log_validation_violations=False,
+        ignore_no_shapes_loaded_exception=True,
+        validation_enabled=True,
+        cache_select_nodes=False,
+        global_log_validation_execution=True,
+        rdfs_sub_class_reasoning=False,
+        performance_logging=True,
+        serializable_validation=False,
+        eclipse_rdf4j_shacl_extensions=True,
+        dash_data_shapes=False,
+        validation_results_limit_total=1000,
+        validation_results_limit_per_constraint=100,
+        iteration_cache_sync_threshold=15000,
+        default_query_evaluation_mode="STANDARD",
+    )
+    return RepositoryConfig(
+        repo_id="shacl_repo", impl=SailRepositoryConfig(sail_impl=shacl_config)
+    )
+
+
+_SHACL_SAIL_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "shacl_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "rdf4j:ShaclSail" ;
+            config:sail.iterationCacheSyncThreshold "15000"^^xsd:integer ;
+            config:sail.defaultQueryEvaluationMode "STANDARD" ;
+            config:shacl.parallelValidation "true"^^xsd:boolean ;
+            config:shacl.undefinedTargetValidatesAllSubjects "false"^^xsd:boolean ;
+            config:shacl.logValidationPlans "true"^^xsd:boolean ;
+            config:shacl.logValidationViolations "false"^^xsd:boolean ;
+            config:shacl.ignoreNoShapesLoadedException "true"^^xsd:boolean ;
+            config:shacl.validationEnabled "true"^^xsd:boolean ;
+            config:shacl.cacheSelectNodes "false"^^xsd:boolean ;
+            config:shacl.globalLogValidationExecution "true"^^xsd:boolean ;
+            config:shacl.rdfsSubClassReasoning "false"^^xsd:boolean ;
+            config:shacl.performanceLogging "true"^^xsd:boolean ;
+            config:shacl.serializableValidation "false"^^xsd:boolean ;
+            config:shacl.eclipseRdf4jShaclExtensions "true"^^xsd:boolean ;
+            config:shacl.dashDataShapes "false"^^xsd:boolean ;
+            config:shacl.validationResultsLimitTotal "1000"^^xsd:integer ;
+            config:shacl.validationResultsLimitPerConstraint "100"^^xsd:integer ;
+            config:delegate [
+                config:sail.type "openrdf:MemoryStore" ;
+                config:mem.persist "true"^^xsd:boolean
+            ]
+        ]
+    ] .
+"""
+
+
+def _shacl_sail_config_minimal() -> RepositoryConfig:
+    """SHACLSailConfig with minimal configuration."""
+    memory_config = MemoryStoreConfig(persist=False)
+    shacl_config = SHACLSailConfig(delegate=memory_config)
+    return RepositoryConfig(
+        repo_id="shacl_minimal_repo",
+        impl=SailRepositoryConfig(sail_impl=shacl_config),
+    )
+
+
+_SHACL_SAIL_CONFIG_MINIMAL_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "shacl_minimal_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "rdf4j:ShaclSail" ;
+            config:delegate [
+                config:sail.type "openrdf:MemoryStore" ;
+                config:mem.persist "false"^^xsd:boolean
+            ]
+        ]
+    ] .
+"""
+
+
+def _nested_inferencer_config() -> RepositoryConfig:
+    """Nested inferencer configurations."""
+    # Create a chain: Memory -> RDFS Inferencer -> Direct Type Hierarchy Inferencer
+    memory_config = MemoryStoreConfig(persist=True)
+    rdfs_config = SchemaCachingRDFSInferencerConfig(
+        delegate=memory_config, iteration_cache_sync_threshold=8000
+    )
+    hierarchy_config = DirectTypeHierarchyInferencerConfig(
+        delegate=rdfs_config, iteration_cache_sync_threshold=12000
+    )
+    return RepositoryConfig(
+        repo_id="nested_repo", impl=SailRepositoryConfig(sail_impl=hierarchy_config)
+    )
+
+
+_NESTED_INFERENCER_CONFIG_TURTLE = b"""
+[] a config:Repository ;
+    config:rep.id "nested_repo" ;
+    config:rep.impl [
+        config:rep.type "openrdf:SailRepository" ;
+        config:sail.impl [
+            config:sail.type "openrdf:DirectTypeHierarchyInferencer" ;
+            config:sail.iterationCacheSyncThreshold "12000"^^xsd:integer ;
+            config:delegate [
+                config:sail.type "rdf4j:SchemaCachingRDFSInferencer" ;
+                config:sail.iterationCacheSyncThreshold "8000"^^xsd:integer ;
+                config:delegate [
+                    config:sail.type "openrdf:MemoryStore" ;
+                    config:mem.persist "true"^^xsd:boolean
+                ]
+            ]
+        ]
+    ] .
+"""
+
+
+CASES: dict[str, tuple[Callable[[], RepositoryConfig], bytes]] = {
+    "minimal_config": (_minimal_config, _MINIMAL_CONFIG_TURTLE),
+    "full_config": (_full_config, _FULL_CONFIG_TURTLE),
+    "sparql_repo_config": (_sparql_repo_config, _SPARQL_REPO_CONFIG_TURTLE),
+    "http_repo_config": (_http_repo_config, _HTTP_REPO_CONFIG_TURTLE),
+    "dataset_repo_config": (_dataset_repo_config, _DATASET_REPO_CONFIG_TURTLE),
+    "native_store_config": (_native_store_config, _NATIVE_STORE_CONFIG_TURTLE),
+    "elasticsearch_store_config": (
+        _elasticsearch_store_config,
+        _ELASTICSEARCH_STORE_CONFIG_TURTLE,
+    ),
+    "memory_store_config_defaults": (
+        _memory_store_config_defaults,
+        _MEMORY_STORE_CONFIG_DEFAULTS_TURTLE,
+    ),
+    "repository_config_with_sail_repository_impl": (
+        _repository_config_with_sail_repository_impl,
+        _REPOSITORY_CONFIG_WITH_SAIL_REPOSITORY_IMPL_TURTLE,
+    ),
+    "schema_caching_rdfs_inferencer_config": (
+        _schema_caching_rdfs_inferencer_config,
+        _SCHEMA_CACHING_RDFS_INFERENCER_CONFIG_TURTLE,
+    ),
+    "direct_type_hierarchy_inferencer_config": (
+        _direct_type_hierarchy_inferencer_config,
+        _DIRECT_TYPE_HIERARCHY_INFERENCER_CONFIG_TURTLE,
+    ),
+    "shacl_sail_config": (_shacl_sail_config, _SHACL_SAIL_CONFIG_TURTLE),
+    "shacl_sail_config_minimal": (
+        _shacl_sail_config_minimal,
+        _SHACL_SAIL_CONFIG_MINIMAL_TURTLE,
+    ),
+    "nested_inferencer_config": (
+        _nested_inferencer_config,
+        _NESTED_INFERENCER_CONFIG_TURTLE,
+    ),
+}
+
+_EXPECTED_DIGESTS = _expected_digests(
+    {case: expected_turtle for case, (_, expected_turtle) in CASES.items()}
+)
 
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "shacl_minimal_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "rdf4j:ShaclSail" ;
-                        config:delegate [
-                            config:sail.type "openrdf:MemoryStore" ;
-                            config:mem.persist "false"^^xsd:boolean
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
-
-    def test_nested_inferencer_config(self):
-        """Test nested inferencer configurations."""
-        # Create a chain: Memory -> RDFS Inferencer -> Direct Type Hierarchy Inferencer
-        memory_config = MemoryStoreConfig(persist=True)
-        rdfs_config = SchemaCachingRDFSInferencerConfig(
-            delegate=memory_config, iteration_cache_sync_threshold=8000
-        )
-        hierarchy_config = DirectTypeHierarchyInferencerConfig(
-            delegate=rdfs_config, iteration_cache_sync_threshold=12000
-        )
-        repo_config = RepositoryConfig(
-            repo_id="nested_repo", impl=SailRepositoryConfig(sail_impl=hierarchy_config)
-        )
 
-        expected_turtle = """
-            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-            @prefix config: <tag:rdf4j.org,2023:config/> .
-            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
-            [] a config:Repository ;
-                config:rep.id "nested_repo" ;
-                config:rep.impl [
-                    config:rep.type "openrdf:SailRepository" ;
-                    config:sail.impl [
-                        config:sail.type "openrdf:DirectTypeHierarchyInferencer" ;
-                        config:sail.iterationCacheSyncThreshold "12000"^^xsd:integer ;
-                        config:delegate [
-                            config:sail.type "rdf4j:SchemaCachingRDFSInferencer" ;
-                            config:sail.iterationCacheSyncThreshold "8000"^^xsd:integer ;
-                            config:delegate [
-                                config:sail.type "openrdf:MemoryStore" ;
-                                config:mem.persist "true"^^xsd:boolean
-                            ]
-                        ]
-                    ]
-                ] .
-        """
-        assert_isomorphic(repo_config.to_turtle(), expected_turtle.encode())
+class TestRepositoryConfig:
+    @pytest.mark.parametrize("case", CASES)
+    def test_config(self, case: str):
+        config_factory, _ = CASES[case]
+        assert_matches_expected(config_factory().to_turtle(), case)
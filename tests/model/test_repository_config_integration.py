@@ -4,8 +4,11 @@ These tests verify that the repository configurations can be used to actually cr
 repositories in an RDF4J server and perform basic operations.
 """
 
+import asyncio
+from collections.abc import Callable, Iterable
+
+import pyoxigraph as og
 import pytest
-from random import randint
 
 from rdf4j_python import AsyncRdf4j
 from rdf4j_python.model.repository_config import (
@@ -20,93 +23,94 @@ from rdf4j_python.model.repository_config import (
     SPARQLRepositoryConfig,
 )
 from rdf4j_python.model.term import IRI, Literal
+from tests._repo_ids import unique_repo_id
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+_RDF_TYPE = IRI("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+_P_TEST = IRI("http://example.com/testPredicate")
+_P_HAS_VALUE = IRI("http://example.com/hasValue")
 
 
-def random_repo_id() -> str:
-    """Generate a random repository ID for testing."""
-    return f"test_repo_{randint(1, 1000000)}"
+def _count(statements: Iterable[og.Quad]) -> int:
+    """Count statements without materializing them."""
+    return sum(1 for _ in statements)
 
 
-@pytest.mark.asyncio
-async def test_memory_store_repository_creation(rdf4j_service: str):
-    """Test creating a repository with MemoryStoreConfig."""
-    repo_id = random_repo_id()
+async def test_list_repositories_round_trip(rdf4j_db: AsyncRdf4j):
+    """Test that a created repository is reported by list_repositories."""
+    repo_id = unique_repo_id()
     config = RepositoryConfig(
         repo_id=repo_id,
-        title="Memory Store Test Repository",
+        title="List Round Trip Test Repository",
         impl=SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
-
-            # Test basic operation - add a statement
-            subject = IRI("http://example.com/subject")
-            predicate = IRI("http://example.com/predicate")
-            obj = Literal("test_value")
-
-            await repo.add_statement(subject, predicate, obj)
-
-            # Verify the statement was added
-            statements = list(await repo.get_statements())
-            assert len(statements) == 1
-            assert statements[0].subject == subject
-            assert statements[0].predicate == predicate
-            assert statements[0].object == obj
-
-        finally:
-            # Clean up
-            await db.delete_repository(repo_id)
-
-
-@pytest.mark.asyncio
-async def test_native_store_repository_creation(rdf4j_service: str):
-    """Test creating a repository with NativeStoreConfig."""
-    repo_id = random_repo_id()
+    await rdf4j_db.create_repository(config=config)
+
+    try:
+        repos = await rdf4j_db.list_repositories()
+        assert repo_id in [r.id for r in repos]
+
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
+
+
+_SAIL_REPOSITORY_CONFIGS: dict[str, Callable[[], SailRepositoryConfig]] = {
+    "memory": lambda: SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
+    "native": lambda: SailRepositoryConfig(
+        sail_impl=NativeStoreConfig(triple_indexes="spoc,posc", force_sync=False)
+    ),
+    "shacl": lambda: SailRepositoryConfig(
+        sail_impl=SHACLSailConfig(
+            delegate=MemoryStoreConfig(persist=False),
+            parallel_validation=True,
+            validation_enabled=True,
+        )
+    ),
+    "convenience": lambda: SailRepositoryConfig(
+        sail_impl=MemoryStoreConfig(persist=True, sync_delay=2000)
+    ),
+}
+
+
+@pytest.mark.parametrize("store", _SAIL_REPOSITORY_CONFIGS)
+async def test_sail_repository_creation(rdf4j_db: AsyncRdf4j, store: str):
+    """Test creating a non-inferencing SAIL repository and adding a statement."""
+    repo_id = unique_repo_id()
     config = RepositoryConfig(
         repo_id=repo_id,
-        title="Native Store Test Repository",
-        impl=SailRepositoryConfig(
-            sail_impl=NativeStoreConfig(triple_indexes="spoc,posc", force_sync=False)
-        ),
+        title=f"{store} Test Repository",
+        impl=_SAIL_REPOSITORY_CONFIGS[store](),
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
+    # Create the repository
+    repo = await rdf4j_db.create_repository(config=config)
 
-            # Test basic operation
-            subject = IRI("http://example.com/native")
-            predicate = IRI("http://example.com/hasValue")
-            obj = Literal("native_value")
+    try:
+        # Test basic operation - add a statement
+        subject = IRI(f"http://example.com/{store}")
+        predicate = _P_HAS_VALUE
+        obj = Literal(f"{store}_value")
 
-            await repo.add_statement(subject, predicate, obj)
+        await repo.add_statement(subject, predicate, obj)
 
-            # Verify the statement was added
-            statements = list(await repo.get_statements())
-            assert len(statements) == 1
+        # Verify the statement was added
+        statements = list(await repo.get_statements())
+        assert len(statements) == 1
+        assert statements[0].subject == subject
+        assert statements[0].predicate == predicate
+        assert statements[0].object == obj
 
-        finally:
-            await db.delete_repository(repo_id)
+    finally:
+        # Clean up
+        await rdf4j_db.delete_repository(repo_id)
 
 
-@pytest.mark.asyncio
-async def test_dataset_repository_creation(rdf4j_service: str):
+async def test_dataset_repository_creation(rdf4j_db: AsyncRdf4j):
     """Test creating a repository with DatasetRepositoryConfig."""
-    repo_id = random_repo_id()
+    repo_id = unique_repo_id()
     memory_config = MemoryStoreConfig(persist=False)
     sail_config = SailRepositoryConfig(sail_impl=memory_config)
     dataset_config = DatasetRepositoryConfig(delegate=sail_config)
@@ -115,37 +119,30 @@ async def test_dataset_repository_creation(rdf4j_service: str):
         repo_id=repo_id, title="Dataset Test Repository", impl=dataset_config
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
+    # Create the repository
+    repo = await rdf4j_db.create_repository(config=config)
 
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
+    try:
+        # Test basic operation with named graph
+        subject = IRI("http://example.com/dataset")
+        predicate = IRI("http://example.com/inGraph")
+        obj = Literal("graph_value")
+        context = IRI("http://example.com/graph1")
 
-            # Test basic operation with named graph
-            subject = IRI("http://example.com/dataset")
-            predicate = IRI("http://example.com/inGraph")
-            obj = Literal("graph_value")
-            context = IRI("http://example.com/graph1")
+        await repo.add_statement(subject, predicate, obj, context=context)
 
-            await repo.add_statement(subject, predicate, obj, context=context)
+        # Verify the statement was added in the correct context
+        statements = list(await repo.get_statements(contexts=[context]))
+        assert len(statements) == 1
+        assert statements[0].subject == subject
 
-            # Verify the statement was added in the correct context
-            statements = list(await repo.get_statements(contexts=[context]))
-            assert len(statements) == 1
-            assert statements[0].subject == subject
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
 
-        finally:
-            await db.delete_repository(repo_id)
 
-
-@pytest.mark.asyncio
-async def test_rdfs_inferencer_repository_creation(rdf4j_service: str):
+async def test_rdfs_inferencer_repository_creation(rdf4j_db: AsyncRdf4j):
     """Test creating a repository with SchemaCachingRDFSInferencerConfig."""
-    repo_id = random_repo_id()
+    repo_id = unique_repo_id()
     memory_config = MemoryStoreConfig(persist=False)
     rdfs_config = SchemaCachingRDFSInferencerConfig(
         delegate=memory_config, iteration_cache_sync_threshold=8000
@@ -157,45 +154,35 @@ async def test_rdfs_inferencer_repository_creation(rdf4j_service: str):
         impl=SailRepositoryConfig(sail_impl=rdfs_config),
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
+    # Create the repository
+    repo = await rdf4j_db.create_repository(config=config)
 
-            # Test basic operation
-            subject = IRI("http://example.com/rdfs")
-            predicate = IRI("http://example.com/hasType")
-            obj = IRI("http://example.com/TestClass")
+    try:
+        # Test basic operation
+        subject = IRI("http://example.com/rdfs")
+        predicate = IRI("http://example.com/hasType")
+        obj = IRI("http://example.com/TestClass")
 
-            await repo.add_statement(subject, predicate, obj)
+        await repo.add_statement(subject, predicate, obj)
 
-            # Verify the statement was added (RDFS inferencer adds many additional statements)
-            statements = list(await repo.get_statements())
-            assert (
-                len(statements) > 1
-            )  # Should have our statement plus many inferred statements
+        # Verify the statement was added (RDFS inferencer adds many additional statements)
+        assert _count(await repo.get_statements()) > 1
 
-            # Check that our specific statement is in there
-            our_statements = [
-                s
-                for s in statements
-                if s.subject == subject and s.predicate == predicate and s.object == obj
-            ]
-            assert len(our_statements) == 1
+        # Check that our specific statement is in there
+        our_statements = await repo.get_statements(
+            subject=subject, predicate=predicate, object_=obj
+        )
+        assert _count(our_statements) == 1
 
-        finally:
-            await db.delete_repository(repo_id)
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
 
 
-@pytest.mark.asyncio
-async def test_direct_type_hierarchy_inferencer_repository_creation(rdf4j_service: str):
+async def test_direct_type_hierarchy_inferencer_repository_creation(
+    rdf4j_db: AsyncRdf4j,
+):
     """Test creating a repository with DirectTypeHierarchyInferencerConfig."""
-    repo_id = random_repo_id()
+    repo_id = unique_repo_id()
     memory_config = MemoryStoreConfig(persist=False)
     hierarchy_config = DirectTypeHierarchyInferencerConfig(
         delegate=memory_config, iteration_cache_sync_threshold=5000
@@ -207,83 +194,30 @@ async def test_direct_type_hierarchy_inferencer_repository_creation(rdf4j_servic
         impl=SailRepositoryConfig(sail_impl=hierarchy_config),
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
-
-            # Test basic operation
-            subject = IRI("http://example.com/hierarchy")
-            predicate = IRI("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
-            obj = IRI("http://example.com/SomeType")
-
-            await repo.add_statement(subject, predicate, obj)
-
-            # Verify the statement was added (DirectTypeHierarchy inferencer may add additional statements)
-            statements = list(await repo.get_statements())
-            assert len(statements) >= 1  # Should have at least our statement
-
-            # Check that our specific statement is in there
-            our_statements = [
-                s
-                for s in statements
-                if s.subject == subject and s.predicate == predicate and s.object == obj
-            ]
-            assert len(our_statements) == 1
+    # Create the repository
+    repo = await rdf4j_db.create_repository(config=config)
 
-        finally:
-            await db.delete_repository(repo_id)
+    try:
+        # Test basic operation
+        subject = IRI("http://example.com/hierarchy")
+        predicate = _RDF_TYPE
+        obj = IRI("http://example.com/SomeType")
 
+        await repo.add_statement(subject, predicate, obj)
 
-@pytest.mark.asyncio
-async def test_shacl_sail_repository_creation(rdf4j_service: str):
-    """Test creating a repository with SHACLSailConfig."""
-    repo_id = random_repo_id()
-    memory_config = MemoryStoreConfig(persist=False)
-    shacl_config = SHACLSailConfig(
-        delegate=memory_config, parallel_validation=True, validation_enabled=True
-    )
-
-    config = RepositoryConfig(
-        repo_id=repo_id,
-        title="SHACL Sail Test Repository",
-        impl=SailRepositoryConfig(sail_impl=shacl_config),
-    )
+        # Verify the statement was added (DirectTypeHierarchy inferencer may add additional statements)
+        our_statements = await repo.get_statements(
+            subject=subject, predicate=predicate, object_=obj
+        )
+        assert _count(our_statements) == 1
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
 
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
 
-            # Test basic operation
-            subject = IRI("http://example.com/shacl")
-            predicate = IRI("http://example.com/validates")
-            obj = Literal("shacl_test")
-
-            await repo.add_statement(subject, predicate, obj)
-
-            # Verify the statement was added
-            statements = list(await repo.get_statements())
-            assert len(statements) == 1
-
-        finally:
-            await db.delete_repository(repo_id)
-
-
-@pytest.mark.asyncio
-async def test_nested_inferencer_repository_creation(rdf4j_service: str):
+async def test_nested_inferencer_repository_creation(rdf4j_db: AsyncRdf4j):
     """Test creating a repository with nested inferencer configurations."""
-    repo_id = random_repo_id()
+    repo_id = unique_repo_id()
 
     # Create a chain: Memory → RDFS Inferencer → Direct Type Hierarchy Inferencer
     memory_config = MemoryStoreConfig(persist=False)
@@ -300,89 +234,38 @@ async def test_nested_inferencer_repository_creation(rdf4j_service: str):
         impl=SailRepositoryConfig(sail_impl=hierarchy_config),
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
-
-            # Test basic operation
-            subject = IRI("http://example.com/nested")
-            predicate = IRI("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
-            obj = IRI("http://example.com/ComplexType")
+    # Create the repository
+    repo = await rdf4j_db.create_repository(config=config)
 
-            await repo.add_statement(subject, predicate, obj)
+    try:
+        # Test basic operation
+        subject = IRI("http://example.com/nested")
+        predicate = _RDF_TYPE
+        obj = IRI("http://example.com/ComplexType")
 
-            # Verify the statement was added (nested inferencers add many additional statements)
-            statements = list(await repo.get_statements())
-            assert (
-                len(statements) > 1
-            )  # Should have our statement plus many inferred statements
+        await repo.add_statement(subject, predicate, obj)
 
-            # Check that our specific statement is in there
-            our_statements = [
-                s
-                for s in statements
-                if s.subject == subject and s.predicate == predicate and s.object == obj
-            ]
-            assert len(our_statements) == 1
+        # Verify the statement was added (nested inferencers add many additional statements)
+        assert _count(await repo.get_statements()) > 1
 
-        finally:
-            await db.delete_repository(repo_id)
+        # Check that our specific statement is in there
+        our_statements = await repo.get_statements(
+            subject=subject, predicate=predicate, object_=obj
+        )
+        assert _count(our_statements) == 1
 
-
-@pytest.mark.asyncio
-async def test_repository_config_convenience_parameter(rdf4j_service: str):
-    """Test creating a repository using SailRepositoryConfig."""
-    repo_id = random_repo_id()
-
-    # Use SailRepositoryConfig directly instead of convenience parameter
-    config = RepositoryConfig(
-        repo_id=repo_id,
-        title="Convenience Parameter Test Repository",
-        impl=SailRepositoryConfig(
-            sail_impl=MemoryStoreConfig(persist=True, sync_delay=2000)
-        ),
-    )
-
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create the repository
-            repo = await db.create_repository(config=config)
-
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
-
-            # Test basic operation
-            subject = IRI("http://example.com/convenience")
-            predicate = IRI("http://example.com/usesConvenienceParam")
-            obj = Literal("true")
-
-            await repo.add_statement(subject, predicate, obj)
-
-            # Verify the statement was added
-            statements = list(await repo.get_statements())
-            assert len(statements) == 1
-
-        finally:
-            await db.delete_repository(repo_id)
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
 
 
 @pytest.mark.skip(reason="Requires external SPARQL endpoint")
-@pytest.mark.asyncio
-async def test_sparql_repository_creation(rdf4j_service: str):
+async def test_sparql_repository_creation(rdf4j_db: AsyncRdf4j):
     """Test creating a repository with SPARQLRepositoryConfig.
 
     Note: This test is skipped because it requires an external SPARQL endpoint.
     In a real test environment, you would need to provide valid endpoints.
     """
-    repo_id = random_repo_id()
+    repo_id = unique_repo_id()
     sparql_config = SPARQLRepositoryConfig(
         query_endpoint="http://example.com/sparql",
         update_endpoint="http://example.com/sparql/update",
@@ -392,38 +275,36 @@ async def test_sparql_repository_creation(rdf4j_service: str):
         repo_id=repo_id, title="SPARQL Test Repository", impl=sparql_config
     )
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # This would create a SPARQL repository if endpoints were valid
-            await db.create_repository(config=config)
+    # This would create a SPARQL repository if endpoints were valid
+    await rdf4j_db.create_repository(config=config)
 
-            # Verify it was created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-            assert repo_id in repo_ids
+    try:
+        # Verify it was created
+        repos = await rdf4j_db.list_repositories()
+        repo_ids = [r.id for r in repos]
+        assert repo_id in repo_ids
 
-        finally:
-            await db.delete_repository(repo_id)
+    finally:
+        await rdf4j_db.delete_repository(repo_id)
 
 
-@pytest.mark.asyncio
-async def test_multiple_repositories_with_different_configs(rdf4j_service: str):
+async def test_multiple_repositories_with_different_configs(rdf4j_db: AsyncRdf4j):
     """Test creating multiple repositories with different configurations simultaneously."""
     configs = [
         RepositoryConfig(
-            repo_id=f"multi_memory_{randint(1, 1000000)}",
+            repo_id=unique_repo_id("multi_memory"),
             title="Multi Test Memory Repository",
             impl=SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
         ),
         RepositoryConfig(
-            repo_id=f"multi_native_{randint(1, 1000000)}",
+            repo_id=unique_repo_id("multi_native"),
             title="Multi Test Native Repository",
             impl=SailRepositoryConfig(
                 sail_impl=NativeStoreConfig(triple_indexes="spoc")
             ),
         ),
         RepositoryConfig(
-            repo_id=f"multi_dataset_{randint(1, 1000000)}",
+            repo_id=unique_repo_id("multi_dataset"),
             title="Multi Test Dataset Repository",
             impl=DatasetRepositoryConfig(
                 delegate=SailRepositoryConfig(
@@ -433,30 +314,45 @@ async def test_multiple_repositories_with_different_configs(rdf4j_service: str):
         ),
     ]
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        try:
-            # Create all repositories
-            for config in configs:
-                await db.create_repository(config=config)
-
-            # Verify all were created
-            repos = await db.list_repositories()
-            repo_ids = [r.id for r in repos]
-
-            for config in configs:
-                assert config.repo_id in repo_ids
-
-                # Test basic operation on each
-                repo = await db.get_repository(config.repo_id)
-                subject = IRI(f"http://example.com/{config.repo_id}")
-                predicate = IRI("http://example.com/testPredicate")
-                obj = Literal(f"test_value_for_{config.repo_id}")
-
-                await repo.add_statement(subject, predicate, obj)
-                statements = list(await repo.get_statements())
-                assert len(statements) == 1
-
-        finally:
-            # Clean up all repositories
-            for config in configs:
-                await db.delete_repository(config.repo_id)
+    async def verify(config: RepositoryConfig) -> None:
+        assert config.repo_id in repo_ids
+
+        # Test basic operation on each
+        repo = await rdf4j_db.get_repository(config.repo_id)
+        subject = IRI(f"http://example.com/{config.repo_id}")
+        predicate = _P_TEST
+        obj = Literal(f"test_value_for_{config.repo_id}")
+
+        await repo.add_statement(subject, predicate, obj)
+        statements = await repo.get_statements(
+            subject=subject, predicate=predicate, object_=obj
+        )
+        assert _count(statements) == 1
+
+    # Create all repositories, remembering which ones need cleaning up
+    results = await asyncio.gather(
+        *(rdf4j_db.create_repository(config=config) for config in configs),
+        return_exceptions=True,
+    )
+    created = [
+        config.repo_id
+        for config, result in zip(configs, results)
+        if not isinstance(result, BaseException)
+    ]
+
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Verify all were created
+        repos = await rdf4j_db.list_repositories()
+        repo_ids = [r.id for r in repos]
+
+        await asyncio.gather(*(verify(config) for config in configs))
+
+    finally:
+        # Clean up the repositories that were created
+        await asyncio.gather(
+            *(rdf4j_db.delete_repository(repo_id) for repo_id in created)
+        )
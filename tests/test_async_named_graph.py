@@ -1,30 +1,60 @@
+from uuid import uuid4
+
 import pytest
+import pytest_asyncio
 
+from rdf4j_python import AsyncRdf4j
+from rdf4j_python._driver._async_named_graph import AsyncNamedGraph
 from rdf4j_python._driver._async_repository import AsyncRdf4JRepository
+from rdf4j_python.model.repository_config import (
+    MemoryStoreConfig,
+    RepositoryConfig,
+    SailRepositoryConfig,
+)
 from rdf4j_python.model.term import IRI, Literal, Quad, Triple
 from rdf4j_python.model.vocabulary import EXAMPLE as ex
+from tests._repo_ids import unique_repo_id
+
+# Tests share one repository and are isolated by writing to their own graph
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_repo(rdf4j_db: AsyncRdf4j):
+    """Fixture that yields a memory repository shared by the whole module."""
+    config = RepositoryConfig(
+        repo_id=unique_repo_id("test_async_named_graph"),
+        title="Named graph tests",
+        impl=SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
+    )
+    repo = await rdf4j_db.create_repository(config=config)
+    yield repo
+    await rdf4j_db.delete_repository(config.repo_id)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def graph(shared_repo: AsyncRdf4JRepository):
+    """Fixture that yields a fresh named graph and clears it afterwards."""
+    named_graph = await shared_repo.get_named_graph(f"test_{uuid4().hex}")
+    yield named_graph
+    await named_graph.clear()
 
 
-@pytest.mark.asyncio
 async def test_async_named_graph_uri(
-    rdf4j_service: str, mem_repo: AsyncRdf4JRepository
+    rdf4j_service: str, shared_repo: AsyncRdf4JRepository
 ):
-    graph = await mem_repo.get_named_graph("test")
+    graph = await shared_repo.get_named_graph("test")
     assert graph.iri == IRI(
-        f"{rdf4j_service}/repositories/{mem_repo.repository_id}/rdf-graphs/test"
+        f"{rdf4j_service}/repositories/{shared_repo.repository_id}/rdf-graphs/test"
     )
 
 
-@pytest.mark.asyncio
-async def test_async_named_graph_add(mem_repo: AsyncRdf4JRepository):
-    graph = await mem_repo.get_named_graph("test")
+async def test_async_named_graph_add(graph: AsyncNamedGraph):
     await graph.add([Triple(ex["subject"], ex["predicate"], ex["object"])])
     assert len(list(await graph.get())) == 1
 
 
-@pytest.mark.asyncio
-async def test_async_named_graph_add_multiple(mem_repo: AsyncRdf4JRepository):
-    graph = await mem_repo.get_named_graph("test")
+async def test_async_named_graph_add_multiple(graph: AsyncNamedGraph):
     await graph.add(
         [
             Triple(ex["subject1"], ex["predicate"], Literal("test_object")),
@@ -34,9 +64,7 @@ async def test_async_named_graph_add_multiple(mem_repo: AsyncRdf4JRepository):
     assert len(list(await graph.get())) == 2
 
 
-@pytest.mark.asyncio
-async def test_async_named_graph_get(mem_repo: AsyncRdf4JRepository):
-    graph = await mem_repo.get_named_graph("test")
+async def test_async_named_graph_get(graph: AsyncNamedGraph):
     statement = Triple(ex["subject"], ex["predicate"], Literal("test_object"))
     await graph.add([statement])
     dataset = list(await graph.get())
@@ -52,9 +80,7 @@ async def test_async_named_graph_get(mem_repo: AsyncRdf4JRepository):
     )
 
 
-@pytest.mark.asyncio
-async def test_async_named_graph_get_multiple(mem_repo: AsyncRdf4JRepository):
-    graph = await mem_repo.get_named_graph("test")
+async def test_async_named_graph_get_multiple(graph: AsyncNamedGraph):
     statement_1 = Triple(ex["subject"], ex["predicate"], Literal("test_object"))
     statement_2 = Triple(ex["subject"], ex["predicate"], Literal("test_object2"))
     await graph.add([statement_1, statement_2])
@@ -80,9 +106,7 @@ async def test_async_named_graph_get_multiple(mem_repo: AsyncRdf4JRepository):
     )
 
 
-@pytest.mark.asyncio
-async def test_async_named_graph_clear(mem_repo: AsyncRdf4JRepository):
-    graph = await mem_repo.get_named_graph("test")
+async def test_async_named_graph_clear(graph: AsyncNamedGraph):
     await graph.add([Triple(ex["subject"], ex["predicate"], ex["object"])])
     assert len(list(await graph.get())) == 1
     await graph.clear()
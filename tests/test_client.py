@@ -1,3 +1,6 @@
+import asyncio
+
+import httpx
 import pytest
 
 from rdf4j_python import AsyncRdf4j
@@ -7,18 +10,20 @@ from rdf4j_python.model.repository_config import (
     SailRepositoryConfig,
 )
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-@pytest.mark.asyncio
 async def test_create_repo(
-    rdf4j_service: str, random_mem_repo_config: RepositoryConfig
+    rdf4j_service: str,
+    rdf4j_db: AsyncRdf4j,
+    random_mem_repo_config: RepositoryConfig,
 ):
-    async with AsyncRdf4j(rdf4j_service) as db:
-        await db.create_repository(config=random_mem_repo_config)
-        repos = await db.list_repositories()
-        assert len(repos) == 1
-        assert repos[0].id == random_mem_repo_config.repo_id
-        assert repos[0].title == random_mem_repo_config.title
-        await db.delete_repository(random_mem_repo_config.repo_id)
+    await rdf4j_db.create_repository(config=random_mem_repo_config)
+    repos = await rdf4j_db.list_repositories()
+    assert len(repos) == 1
+    assert repos[0].id == random_mem_repo_config.repo_id
+    assert repos[0].title == random_mem_repo_config.title
+    await rdf4j_db.delete_repository(random_mem_repo_config.repo_id)
 
     # test without async context manager
     db = AsyncRdf4j(rdf4j_service)
@@ -31,70 +36,74 @@ async def test_create_repo(
     await db.aclose()
 
 
-@pytest.mark.asyncio
 async def test_delete_repo(
-    rdf4j_service: str, random_mem_repo_config: RepositoryConfig
+    rdf4j_service: str,
+    rdf4j_db: AsyncRdf4j,
+    random_mem_repo_config: RepositoryConfig,
 ):
-    async with AsyncRdf4j(rdf4j_service) as db:
-        await db.create_repository(
-            config=random_mem_repo_config,
-        )
-        repos = await db.list_repositories()
-        assert len(repos) == 1
-        assert repos[0].id == random_mem_repo_config.repo_id
-        assert repos[0].title == random_mem_repo_config.title
-        await db.delete_repository(random_mem_repo_config.repo_id)
-        repos = await db.list_repositories()
-        assert len(repos) == 0
+    repo_id = random_mem_repo_config.repo_id
+    await rdf4j_db.create_repository(
+        config=random_mem_repo_config,
+    )
+    assert await rdf4j_db.repository_exists(repo_id)
+    await rdf4j_db.delete_repository(repo_id)
+    assert not await rdf4j_db.repository_exists(repo_id)
 
     # test with out async context manager
     db = AsyncRdf4j(rdf4j_service)
     await db.create_repository(config=random_mem_repo_config)
-    repos = await db.list_repositories()
-    assert len(repos) == 1
-    assert repos[0].id == random_mem_repo_config.repo_id
-    assert repos[0].title == random_mem_repo_config.title
-    await db.delete_repository(random_mem_repo_config.repo_id)
-    repos = await db.list_repositories()
-    assert len(repos) == 0
+    assert await db.repository_exists(repo_id)
+    await db.delete_repository(repo_id)
+    assert not await db.repository_exists(repo_id)
+    await db.aclose()
+
+
+async def test_repository_exists_raises_on_server_error():
+    def respond(request: httpx.Request) -> httpx.Response:
+        assert request.method == "HEAD"
+        return httpx.Response(httpx.codes.INTERNAL_SERVER_ERROR, request=request)
+
+    db = AsyncRdf4j("http://rdf4j.invalid/rdf4j-server")
+    db._client.client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    with pytest.raises(httpx.HTTPStatusError):
+        await db.repository_exists("broken")
     await db.aclose()
 
 
-@pytest.mark.asyncio
-async def test_list_repos(rdf4j_service: str):
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo_count = 10
-        repos = await db.list_repositories()
-        assert len(repos) == 0
-        for repo in range(repo_count):
-            repo_id = f"test_list_repos_{repo}"
-            title = f"test_list_repos_{repo}_title"
-            repo_config = RepositoryConfig(
-                repo_id=repo_id,
-                title=title,
-                impl=SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
-            )
-            await db.create_repository(
-                config=repo_config,
-            )
-        repo_list = await db.list_repositories()
-        assert len(repo_list) == repo_count
-        for repo in range(repo_count):
-            assert f"test_list_repos_{repo}" in [repo.id for repo in repo_list]
-            assert f"test_list_repos_{repo}_title" in [repo.title for repo in repo_list]
-            await db.delete_repository(f"test_list_repos_{repo}")
-
-
-@pytest.mark.asyncio
+async def test_list_repos(rdf4j_db: AsyncRdf4j):
+    repo_count = 10
+    repos = await rdf4j_db.list_repositories()
+    assert len(repos) == 0
+    impl = SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False))
+    repo_configs = [
+        RepositoryConfig(
+            repo_id=f"test_list_repos_{repo}",
+            title=f"test_list_repos_{repo}_title",
+            impl=impl,
+        )
+        for repo in range(repo_count)
+    ]
+    await asyncio.gather(
+        *(rdf4j_db.create_repository(config=config) for config in repo_configs)
+    )
+    repo_list = await rdf4j_db.list_repositories()
+    assert len(repo_list) == repo_count
+    for repo in range(repo_count):
+        assert f"test_list_repos_{repo}" in [repo.id for repo in repo_list]
+        assert f"test_list_repos_{repo}_title" in [repo.title for repo in repo_list]
+    await asyncio.gather(
+        *(rdf4j_db.delete_repository(config.repo_id) for config in repo_configs)
+    )
+
+
 async def test_create_memory_store_repo(
-    rdf4j_service: str, random_mem_repo_config: RepositoryConfig
+    rdf4j_db: AsyncRdf4j, random_mem_repo_config: RepositoryConfig
 ):
-    async with AsyncRdf4j(rdf4j_service) as db:
-        await db.create_repository(
-            config=random_mem_repo_config,
-        )
-        repo_list = await db.list_repositories()
-        assert len(repo_list) == 1
-        assert repo_list[0].id == random_mem_repo_config.repo_id
-        assert repo_list[0].title == random_mem_repo_config.title
-        await db.delete_repository(random_mem_repo_config.repo_id)
+    await rdf4j_db.create_repository(
+        config=random_mem_repo_config,
+    )
+    repo_list = await rdf4j_db.list_repositories()
+    assert len(repo_list) == 1
+    assert repo_list[0].id == random_mem_repo_config.repo_id
+    assert repo_list[0].title == random_mem_repo_config.title
+    await rdf4j_db.delete_repository(random_mem_repo_config.repo_id)
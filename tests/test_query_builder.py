@@ -88,6 +88,13 @@ class TestSerializeTerm:
         with pytest.raises(TypeError):
             serialize_term(42)
 
+    @pytest.mark.parametrize("term", [["?s"], {"?s": "?o"}])
+    def test_unsupported_unhashable_type(self, term):
+        from rdf4j_python.query._term import serialize_term
+
+        with pytest.raises(TypeError, match="Unsupported term type"):
+            serialize_term(term)
+
     def test_literal_with_quotes(self):
         from rdf4j_python.query._term import serialize_term
 
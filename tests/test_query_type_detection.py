@@ -1,5 +1,7 @@
 """Tests for SPARQL query type detection."""
 
+import time
+
 from rdf4j_python._driver._async_repository import _detect_query_type
 
 
@@ -133,3 +135,40 @@ class TestQueryTypeDetection:
         DELETE WHERE { ?s ex:obsolete ?o }
         """
         assert _detect_query_type(query) == "DELETE"
+
+    def test_prefix_iri_with_fragment(self):
+        query = """
+        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        ASK { ?s rdf:type ?o }
+        """
+        assert _detect_query_type(query) == "ASK"
+
+    def test_comment_directly_after_keyword(self):
+        query = "SELECT# all bindings\n* WHERE { ?s ?p ?o }"
+        assert _detect_query_type(query) == "SELECT"
+
+    def test_comment_inside_prefix_declaration(self):
+        query = "PREFIX ex: # c\n <http://ex/>\nSELECT * {}"
+        assert _detect_query_type(query) == "SELECT"
+
+    def test_comment_inside_base_declaration(self):
+        query = "BASE # base IRI\n<http://example.org/>\nASK { ?s ?p ?o }"
+        assert _detect_query_type(query) == "ASK"
+
+    def test_keyword_directly_followed_by_body(self):
+        assert _detect_query_type("ASK{}") == "ASK"
+        assert _detect_query_type("ASK{ ?s ?p ?o }") == "ASK"
+        assert _detect_query_type("SELECT?s{ ?s ?p ?o }") == "SELECT"
+        assert _detect_query_type("DESCRIBE?x") == "DESCRIBE"
+        assert _detect_query_type("SELECT*{ ?s ?p ?o }") == "SELECT"
+        assert _detect_query_type("SELECT(COUNT(*) AS ?n){ ?s ?p ?o }") == "SELECT"
+        assert _detect_query_type("DESCRIBE<http://example.org/x>") == "DESCRIBE"
+
+    def test_unterminated_declaration_with_many_comment_markers(self):
+        # A failed PREFIX/BASE must not backtrack over every way of splitting
+        # the "#" run into comments.
+        for declaration in ("PREFIX ", "PREFIX ex: ", "BASE "):
+            query = declaration + "#" * 5000 + "\nSELECT * {}"
+            start = time.perf_counter()
+            _detect_query_type(query)
+            assert time.perf_counter() - start < 1.0
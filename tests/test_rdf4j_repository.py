@@ -1,7 +1,7 @@
 import pytest
 from pyoxigraph import QuerySolutions
 
-from rdf4j_python import AsyncRdf4JRepository
+from rdf4j_python import AsyncRdf4j, AsyncRdf4JRepository
 from rdf4j_python.exception.repo_exception import (
     NamespaceException,
     RepositoryNotFoundException,
@@ -16,61 +16,45 @@ ex_ns = ex.namespace
 rdf_ns = RDF.namespace
 rdfs_ns = RDFS.namespace
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-@pytest.mark.asyncio
 async def test_repo_size(mem_repo: AsyncRdf4JRepository):
     size = await mem_repo.size()
     assert size == 0
 
 
-@pytest.mark.asyncio
-async def test_repo_size_not_found(rdf4j_service: str):
-    from rdf4j_python import AsyncRdf4j
-
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.get_repository("not_found")
-        with pytest.raises(RepositoryNotFoundException):
-            await repo.size()
+async def test_repo_size_not_found(rdf4j_db: AsyncRdf4j):
+    repo = await rdf4j_db.get_repository("not_found")
+    with pytest.raises(RepositoryNotFoundException):
+        await repo.size()
 
 
-@pytest.mark.asyncio
 async def test_repo_set_namespace(mem_repo: AsyncRdf4JRepository):
     await mem_repo.set_namespace("ex", ex_ns)
 
 
-@pytest.mark.asyncio
-async def test_repo_set_namespace_not_found(rdf4j_service: str):
-    from rdf4j_python import AsyncRdf4j
-
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.get_repository("not_found")
-        with pytest.raises((RepositoryNotFoundException, NamespaceException)):
-            await repo.set_namespace("ex", ex_ns)
+async def test_repo_set_namespace_not_found(rdf4j_db: AsyncRdf4j):
+    repo = await rdf4j_db.get_repository("not_found")
+    with pytest.raises((RepositoryNotFoundException, NamespaceException)):
+        await repo.set_namespace("ex", ex_ns)
 
 
-@pytest.mark.asyncio
 async def test_repo_get_namespaces(mem_repo: AsyncRdf4JRepository):
-    await mem_repo.set_namespace("ex", ex_ns)
-    await mem_repo.set_namespace("rdf", rdf_ns)
+    await mem_repo.set_namespaces({"ex": ex_ns, "rdf": rdf_ns})
     namespaces = await mem_repo.get_namespaces()
     assert len(namespaces) == 2
-    assert namespaces[0].prefix == "ex"
-    assert namespaces[0].namespace == ex_ns
-    assert namespaces[1].prefix == "rdf"
-    assert namespaces[1].namespace == rdf_ns
-
+    by_prefix = {ns.prefix: ns for ns in namespaces}
+    assert by_prefix["ex"].namespace == ex_ns
+    assert by_prefix["rdf"].namespace == rdf_ns
 
-@pytest.mark.asyncio
-async def test_repo_get_namespace_not_found(rdf4j_service: str):
-    from rdf4j_python import AsyncRdf4j
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.get_repository("not_found")
-        with pytest.raises(RepositoryNotFoundException):
-            await repo.get_namespace("ex")
+async def test_repo_get_namespace_not_found(rdf4j_db: AsyncRdf4j):
+    repo = await rdf4j_db.get_repository("not_found")
+    with pytest.raises(RepositoryNotFoundException):
+        await repo.get_namespace("ex")
 
 
-@pytest.mark.asyncio
 async def test_repo_get_namespace(mem_repo: AsyncRdf4JRepository):
     await mem_repo.set_namespace("ex", ex_ns)
     namespace = await mem_repo.get_namespace("ex")
@@ -78,20 +62,14 @@ async def test_repo_get_namespace(mem_repo: AsyncRdf4JRepository):
     assert namespace.namespace == ex_ns
 
 
-@pytest.mark.asyncio
-async def test_repo_delete_namespace_not_found(rdf4j_service: str):
-    from rdf4j_python import AsyncRdf4j
-
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.get_repository("not_found")
-        with pytest.raises(RepositoryNotFoundException):
-            await repo.delete_namespace("ex")
+async def test_repo_delete_namespace_not_found(rdf4j_db: AsyncRdf4j):
+    repo = await rdf4j_db.get_repository("not_found")
+    with pytest.raises(RepositoryNotFoundException):
+        await repo.delete_namespace("ex")
 
 
-@pytest.mark.asyncio
 async def test_repo_delete_namespace(mem_repo: AsyncRdf4JRepository):
-    await mem_repo.set_namespace("rdf", rdf_ns)
-    await mem_repo.set_namespace("ex", ex_ns)
+    await mem_repo.set_namespaces({"rdf": rdf_ns, "ex": ex_ns})
     assert len(await mem_repo.get_namespaces()) == 2
     await mem_repo.delete_namespace("ex")
     namespaces = await mem_repo.get_namespaces()
@@ -100,17 +78,22 @@ async def test_repo_delete_namespace(mem_repo: AsyncRdf4JRepository):
     assert namespaces[0].namespace == rdf_ns
 
 
-@pytest.mark.asyncio
+async def test_repo_set_namespaces_overwrites_existing(mem_repo: AsyncRdf4JRepository):
+    await mem_repo.set_namespace("ex", rdfs_ns)
+    await mem_repo.set_namespaces({"ex": ex_ns, "rdf": rdf_ns})
+    # An empty mapping sends no requests and leaves the namespaces untouched
+    await mem_repo.set_namespaces({})
+    namespaces = {ns.prefix: ns.namespace for ns in await mem_repo.get_namespaces()}
+    assert namespaces == {"ex": ex_ns, "rdf": rdf_ns}
+
+
 async def test_repo_clear_all_namespaces(mem_repo: AsyncRdf4JRepository):
-    await mem_repo.set_namespace("ex", ex_ns)
-    await mem_repo.set_namespace("rdf", rdf_ns)
-    await mem_repo.set_namespace("rdfs", rdfs_ns)
+    await mem_repo.set_namespaces({"ex": ex_ns, "rdf": rdf_ns, "rdfs": rdfs_ns})
     assert len(await mem_repo.get_namespaces()) == 3
     await mem_repo.clear_all_namespaces()
     assert len(await mem_repo.get_namespaces()) == 0
 
 
-@pytest.mark.asyncio
 async def test_repo_add_statement(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statement(
         ex["subject"],
@@ -125,7 +108,6 @@ async def test_repo_add_statement(mem_repo: AsyncRdf4JRepository):
     )
 
 
-@pytest.mark.asyncio
 async def test_repo_add_statements(mem_repo: AsyncRdf4JRepository):
     statements = [
         Triple(ex["subject1"], ex["predicate"], Literal("test_object")),
@@ -136,7 +118,6 @@ async def test_repo_add_statements(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(statements)
 
 
-@pytest.mark.asyncio
 async def test_repo_get_statements(mem_repo: AsyncRdf4JRepository):
     statement_1 = Quad(
         ex["subject1"],
@@ -168,7 +149,6 @@ async def test_repo_get_statements(mem_repo: AsyncRdf4JRepository):
     assert statement_4 in context_resultset
 
 
-@pytest.mark.asyncio
 async def test_repo_delete_statements(mem_repo: AsyncRdf4JRepository):
     statement_1 = Quad(ex["subject1"], ex["predicate"], Literal("test_object"), None)
     statement_2 = Quad(ex["subject2"], ex["predicate"], Literal("test_object2"), None)
@@ -190,7 +170,6 @@ async def test_repo_delete_statements(mem_repo: AsyncRdf4JRepository):
     assert len(list(await mem_repo.get_statements())) == 0
 
 
-@pytest.mark.asyncio
 async def test_repo_replace_statements(mem_repo: AsyncRdf4JRepository):
     old_statement_1 = Quad(
         ex["subject1"], ex["predicate"], Literal("test_object"), None
@@ -216,7 +195,6 @@ async def test_repo_replace_statements(mem_repo: AsyncRdf4JRepository):
     assert old_statement_2 not in resultSet
 
 
-@pytest.mark.asyncio
 async def test_repo_replace_statements_contexts(mem_repo: AsyncRdf4JRepository):
     old_statement_1 = Quad(
         ex["subject1"],
@@ -260,7 +238,6 @@ async def test_repo_replace_statements_contexts(mem_repo: AsyncRdf4JRepository):
     assert old_statement_2 not in resultSet
 
 
-@pytest.mark.asyncio
 async def test_repo_query_simple_select(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(
         [
@@ -280,7 +257,6 @@ async def test_repo_query_simple_select(mem_repo: AsyncRdf4JRepository):
     assert result_list[1]["o"] == Literal("test_object2")
 
 
-@pytest.mark.asyncio
 async def test_repo_query_simple_select_with_filter(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(
         [
@@ -292,14 +268,12 @@ async def test_repo_query_simple_select_with_filter(mem_repo: AsyncRdf4JReposito
         "SELECT * WHERE { ?s ?p ?o FILTER(?o = 'test_object') }"
     )
     assert isinstance(result, QuerySolutions)
-    result_list = list(result)
-    assert len(result_list) == 1
-    assert result_list[0]["s"] == ex["subject1"]
-    assert result_list[0]["p"] == ex["predicate"]
-    assert result_list[0]["o"] == Literal("test_object")
+    (solution,) = result
+    assert solution["s"] == ex["subject1"]
+    assert solution["p"] == ex["predicate"]
+    assert solution["o"] == Literal("test_object")
 
 
-@pytest.mark.asyncio
 async def test_repo_group_by(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(
         [
@@ -317,7 +291,6 @@ async def test_repo_group_by(mem_repo: AsyncRdf4JRepository):
     assert result_list[1]["count"] == Literal(1)
 
 
-@pytest.mark.asyncio
 async def test_repo_query_with_order_by(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(
         [
@@ -335,7 +308,6 @@ async def test_repo_query_with_order_by(mem_repo: AsyncRdf4JRepository):
     assert result_list[2]["s"] == ex["subject3"]
 
 
-@pytest.mark.asyncio
 async def test_repo_query_with_limit(mem_repo: AsyncRdf4JRepository):
     await mem_repo.add_statements(
         [
@@ -356,7 +328,6 @@ async def test_repo_query_with_limit(mem_repo: AsyncRdf4JRepository):
     assert result_list[1]["o"] == Literal("test_object2")
 
 
-@pytest.mark.asyncio
 async def test_repo_update(mem_repo: AsyncRdf4JRepository):
     await mem_repo.update(
         'INSERT DATA { <http://example.org/subject1> <http://example.org/predicate> "test_object1" }',
@@ -364,27 +335,21 @@ async def test_repo_update(mem_repo: AsyncRdf4JRepository):
     )
     result = await mem_repo.query("SELECT * WHERE { ?s ?p ?o }")
     assert isinstance(result, QuerySolutions)
-    result_list = list(result)
-    assert len(result_list) == 1
-    assert result_list[0]["s"] == ex["subject1"]
-    assert result_list[0]["p"] == ex["predicate"]
-    assert result_list[0]["o"] == Literal("test_object1")
-
+    (solution,) = result
+    assert solution["s"] == ex["subject1"]
+    assert solution["p"] == ex["predicate"]
+    assert solution["o"] == Literal("test_object1")
 
-@pytest.mark.asyncio
-async def test_repo_update_not_found(rdf4j_service: str):
-    from rdf4j_python import AsyncRdf4j
 
-    async with AsyncRdf4j(rdf4j_service) as db:
-        repo = await db.get_repository("not_found")
-        with pytest.raises(RepositoryNotFoundException):
-            await repo.update(
-                "INSERT DATA { <http://example.org/subject1> <http://example.org/predicate> 'test_object1' }",
-                Rdf4jContentType.SPARQL_UPDATE,
-            )
+async def test_repo_update_not_found(rdf4j_db: AsyncRdf4j):
+    repo = await rdf4j_db.get_repository("not_found")
+    with pytest.raises(RepositoryNotFoundException):
+        await repo.update(
+            "INSERT DATA { <http://example.org/subject1> <http://example.org/predicate> 'test_object1' }",
+            Rdf4jContentType.SPARQL_UPDATE,
+        )
 
 
-@pytest.mark.asyncio
 async def test_repo_update_invalid_query(mem_repo: AsyncRdf4JRepository):
     with pytest.raises(RepositoryUpdateException):
         await mem_repo.update(
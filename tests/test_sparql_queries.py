@@ -2,16 +2,41 @@ import pytest
 import pytest_asyncio
 from pyoxigraph import QuerySolutions, QueryTriples, QueryBoolean
 
-from rdf4j_python import AsyncRdf4JRepository
+from rdf4j_python import AsyncRdf4j
+from rdf4j_python.model.repository_config import (
+    MemoryStoreConfig,
+    RepositoryConfig,
+    SailRepositoryConfig,
+)
 from rdf4j_python.model.term import IRI, Literal, Quad
 from rdf4j_python.model.vocabulary import EXAMPLE as ex
 from rdf4j_python.model.vocabulary import RDF, XSD
+from tests._repo_ids import unique_repo_id
+
+
+# The sample repository is shared by every test in the module
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+ALICE = IRI("http://example.org/alice")
+BOB = IRI("http://example.org/bob")
+CHARLIE = IRI("http://example.org/charlie")
+COMPANY_A = IRI("http://example.org/company_a")
+COMPANY_B = IRI("http://example.org/company_b")
 
 
 # Sample RDF data for testing
-@pytest_asyncio.fixture
-async def sample_data_repo(mem_repo: AsyncRdf4JRepository):
-    """Repository with comprehensive sample data for SPARQL testing."""
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def sample_data_repo(rdf4j_db: AsyncRdf4j):
+    """Repository with comprehensive sample data for SPARQL testing.
+
+    The repository is created once per module, so tests must only read from it.
+    """
+    config = RepositoryConfig(
+        repo_id=unique_repo_id("test_sparql_queries"),
+        title="SPARQL queries sample data",
+        impl=SailRepositoryConfig(sail_impl=MemoryStoreConfig(persist=False)),
+    )
+    repo = await rdf4j_db.create_repository(config=config)
 
     # Person data
     people_data = [
@@ -81,15 +106,16 @@ async def sample_data_repo(mem_repo: AsyncRdf4JRepository):
     ]
 
     all_data = people_data + company_data + employment_data + friendship_data
-    await mem_repo.add_statements(all_data)
+    await repo.add_statements(all_data)
 
-    return mem_repo
+    yield repo
+
+    await rdf4j_db.delete_repository(config.repo_id)
 
 
 class TestSelectQueries:
     """Test cases for SPARQL SELECT queries."""
 
-    @pytest.mark.asyncio
     async def test_select_all_people(self, sample_data_repo):
         """Test basic SELECT query to get all people."""
         query = """
@@ -107,7 +133,6 @@ class TestSelectQueries:
         names = {solution["name"].value for solution in results_list}
         assert names == {"Alice", "Bob", "Charlie"}
 
-    @pytest.mark.asyncio
     async def test_select_with_filter(self, sample_data_repo):
         """Test SELECT query with FILTER clause."""
         query = """
@@ -120,12 +145,10 @@ class TestSelectQueries:
         result = await sample_data_repo.query(query)
         assert isinstance(result, QuerySolutions)
 
-        results_list = list(result)
-        assert len(results_list) == 1
-        assert results_list[0]["name"].value == "Charlie"
-        assert int(results_list[0]["age"].value) == 45
+        (solution,) = result
+        assert solution["name"].value == "Charlie"
+        assert int(solution["age"].value) == 45
 
-    @pytest.mark.asyncio
     async def test_select_with_optional(self, sample_data_repo):
         """Test SELECT query with OPTIONAL clause."""
         query = """
@@ -159,7 +182,6 @@ class TestSelectQueries:
         except KeyError:
             pass  # Missing key is also acceptable
 
-    @pytest.mark.asyncio
     async def test_select_with_join(self, sample_data_repo):
         """Test SELECT query with JOIN across graphs."""
         query = """
@@ -184,7 +206,6 @@ class TestSelectQueries:
         assert results_by_person["Bob"]["company"].value == "DataInc"
         assert results_by_person["Charlie"]["company"].value == "TechCorp"
 
-    @pytest.mark.asyncio
     async def test_select_with_aggregation(self, sample_data_repo):
         """Test SELECT query with aggregation functions."""
         query = """
@@ -195,16 +216,14 @@ class TestSelectQueries:
         result = await sample_data_repo.query(query)
         assert isinstance(result, QuerySolutions)
 
-        results_list = list(result)
-        assert len(results_list) == 1
+        (solution,) = result
 
-        total_people = int(results_list[0]["totalPeople"].value)
-        avg_age = float(results_list[0]["avgAge"].value)
+        total_people = int(solution["totalPeople"].value)
+        avg_age = float(solution["avgAge"].value)
 
         assert total_people == 3
         assert avg_age == (30 + 25 + 45) / 3
 
-    @pytest.mark.asyncio
     async def test_select_with_order_by(self, sample_data_repo):
         """Test SELECT query with ORDER BY clause."""
         query = """
@@ -227,7 +246,6 @@ class TestSelectQueries:
         names = [solution["name"].value for solution in results_list]
         assert names == ["Bob", "Alice", "Charlie"]
 
-    @pytest.mark.asyncio
     async def test_select_with_limit(self, sample_data_repo):
         """Test SELECT query with LIMIT clause."""
         query = """
@@ -246,7 +264,6 @@ class TestSelectQueries:
 class TestAskQueries:
     """Test cases for SPARQL ASK queries."""
 
-    @pytest.mark.asyncio
     async def test_ask_person_exists(self, sample_data_repo):
         """Test ASK query to check if specific person exists."""
         query = """
@@ -258,7 +275,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is True
 
-    @pytest.mark.asyncio
     async def test_ask_person_not_exists(self, sample_data_repo):
         """Test ASK query for non-existent person."""
         query = """
@@ -270,7 +286,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is False
 
-    @pytest.mark.asyncio
     async def test_ask_with_filter(self, sample_data_repo):
         """Test ASK query with FILTER clause."""
         query = """
@@ -283,7 +298,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is True  # Charlie is 45
 
-    @pytest.mark.asyncio
     async def test_ask_with_filter_false(self, sample_data_repo):
         """Test ASK query with FILTER that should return false."""
         query = """
@@ -296,7 +310,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is False
 
-    @pytest.mark.asyncio
     async def test_ask_relationship_exists(self, sample_data_repo):
         """Test ASK query to check if relationships exist."""
         query = """
@@ -308,7 +321,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is True
 
-    @pytest.mark.asyncio
     async def test_ask_specific_relationship(self, sample_data_repo):
         """Test ASK query for specific relationship."""
         query = """
@@ -320,7 +332,6 @@ class TestAskQueries:
         assert isinstance(result, QueryBoolean)
         assert bool(result) is True
 
-    @pytest.mark.asyncio
     async def test_ask_email_exists(self, sample_data_repo):
         """Test ASK query to check if any email addresses exist."""
         query = """
@@ -336,7 +347,6 @@ class TestAskQueries:
 class TestConstructQueries:
     """Test cases for SPARQL CONSTRUCT queries."""
 
-    @pytest.mark.asyncio
     async def test_construct_simplified_person_data(self, sample_data_repo):
         """Test CONSTRUCT query to create simplified person data."""
         query = """
@@ -366,7 +376,6 @@ class TestConstructQueries:
         }
         assert predicates == expected_predicates
 
-    @pytest.mark.asyncio
     async def test_construct_employment_relationships(self, sample_data_repo):
         """Test CONSTRUCT query to create employment relationships."""
         query = """
@@ -386,20 +395,17 @@ class TestConstructQueries:
 
         # Check that all triples have the correct predicate
         for triple in triples_list:
-            assert str(triple.predicate) == "<http://example.org/employedBy>"
+            assert triple.predicate == ex["employedBy"]
 
         # Check specific relationships
-        company_by_person = {}
-        for triple in triples_list:
-            person_uri = str(triple.subject)
-            company_name = triple.object.value
-            company_by_person[person_uri] = company_name
+        company_by_person = {
+            triple.subject: triple.object.value for triple in triples_list
+        }
 
-        assert company_by_person["<http://example.org/alice>"] == "TechCorp"
-        assert company_by_person["<http://example.org/bob>"] == "DataInc"
-        assert company_by_person["<http://example.org/charlie>"] == "TechCorp"
+        assert company_by_person[ALICE] == "TechCorp"
+        assert company_by_person[BOB] == "DataInc"
+        assert company_by_person[CHARLIE] == "TechCorp"
 
-    @pytest.mark.asyncio
     async def test_construct_with_filter(self, sample_data_repo):
         """Test CONSTRUCT query with FILTER clause."""
         query = """
@@ -415,15 +421,12 @@ class TestConstructQueries:
         result = await sample_data_repo.query(query)
         assert isinstance(result, QueryTriples)
 
-        triples_list = list(result)
-        assert len(triples_list) == 1  # Only Charlie is > 30
+        (triple,) = result  # Only Charlie is > 30
 
-        triple = triples_list[0]
-        assert str(triple.subject) == "<http://example.org/charlie>"
-        assert str(triple.predicate) == "<http://example.org/isSenior>"
+        assert triple.subject == CHARLIE
+        assert triple.predicate == ex["isSenior"]
         assert triple.object.value == "true"
 
-    @pytest.mark.asyncio
     async def test_construct_social_network(self, sample_data_repo):
         """Test CONSTRUCT query to create social network data."""
         query = """
@@ -445,13 +448,12 @@ class TestConstructQueries:
 
         # Check that all triples use the connected predicate
         for triple in triples_list:
-            assert str(triple.predicate) == "<http://example.org/connected>"
+            assert triple.predicate == ex["connected"]
 
 
 class TestDescribeQueries:
     """Test cases for SPARQL DESCRIBE queries."""
 
-    @pytest.mark.asyncio
     async def test_describe_specific_person(self, sample_data_repo):
         """Test DESCRIBE query for a specific person."""
         query = """
@@ -464,11 +466,9 @@ class TestDescribeQueries:
         assert len(triples_list) > 0
 
         # All triples should have Alice as subject or object
-        alice_uri = IRI("http://example.org/alice")
         for triple in triples_list:
-            assert triple.subject == alice_uri or triple.object == alice_uri
+            assert triple.subject == ALICE or triple.object == ALICE
 
-    @pytest.mark.asyncio
     async def test_describe_with_where(self, sample_data_repo):
         """Test DESCRIBE query with WHERE clause."""
         query = """
@@ -484,11 +484,9 @@ class TestDescribeQueries:
         assert len(triples_list) > 0
 
         # Should describe Charlie (only person > 30)
-        charlie_uri = IRI("http://example.org/charlie")
-        charlie_triples = [t for t in triples_list if t.subject == charlie_uri]
+        charlie_triples = [t for t in triples_list if t.subject == CHARLIE]
         assert len(charlie_triples) > 0
 
-    @pytest.mark.asyncio
     async def test_describe_multiple_resources(self, sample_data_repo):
         """Test DESCRIBE query for multiple resources."""
         query = """
@@ -504,16 +502,12 @@ class TestDescribeQueries:
         assert len(triples_list) > 0
 
         # Should describe Alice and Charlie (people with email)
-        alice_uri = IRI("http://example.org/alice")
-        charlie_uri = IRI("http://example.org/charlie")
-
-        alice_triples = [t for t in triples_list if t.subject == alice_uri]
-        charlie_triples = [t for t in triples_list if t.subject == charlie_uri]
+        alice_triples = [t for t in triples_list if t.subject == ALICE]
+        charlie_triples = [t for t in triples_list if t.subject == CHARLIE]
 
         assert len(alice_triples) > 0
         assert len(charlie_triples) > 0
 
-    @pytest.mark.asyncio
     async def test_describe_companies(self, sample_data_repo):
         """Test DESCRIBE query for companies."""
         query = """
@@ -528,11 +522,8 @@ class TestDescribeQueries:
         assert len(triples_list) > 0
 
         # Should describe both companies
-        company_a_uri = IRI("http://example.org/company_a")
-        company_b_uri = IRI("http://example.org/company_b")
-
-        company_a_triples = [t for t in triples_list if t.subject == company_a_uri]
-        company_b_triples = [t for t in triples_list if t.subject == company_b_uri]
+        company_a_triples = [t for t in triples_list if t.subject == COMPANY_A]
+        company_b_triples = [t for t in triples_list if t.subject == COMPANY_B]
 
         assert len(company_a_triples) > 0
         assert len(company_b_triples) > 0
@@ -541,7 +532,6 @@ class TestDescribeQueries:
 class TestComplexQueries:
     """Test cases for complex SPARQL queries combining multiple patterns."""
 
-    @pytest.mark.asyncio
     async def test_complex_select_with_multiple_joins(self, sample_data_repo):
         """Test complex SELECT with multiple joins and filters."""
         query = """
@@ -570,7 +560,6 @@ class TestComplexQueries:
         }  # Alice knows Bob/Charlie and is under 35, Bob knows Alice and is under 35
         assert person_names == expected_names
 
-    @pytest.mark.asyncio
     async def test_complex_construct_with_calculations(self, sample_data_repo):
         """Test CONSTRUCT query creating derived data."""
         query = """
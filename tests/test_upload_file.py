@@ -7,11 +7,12 @@ from pyoxigraph import QuerySolutions
 from rdf4j_python import AsyncRdf4JRepository
 from rdf4j_python.model.term import IRI, Literal
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 # Path to test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.mark.asyncio
 async def test_upload_turtle_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading a Turtle file to the repository."""
     # Upload the sample Turtle file
@@ -29,7 +30,6 @@ async def test_upload_turtle_file(mem_repo: AsyncRdf4JRepository):
     assert result_list[1]["s"] == IRI("http://example.org/subject2")
 
 
-@pytest.mark.asyncio
 async def test_upload_ntriples_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading an N-Triples file to the repository."""
     # Upload the sample N-Triples file
@@ -44,7 +44,6 @@ async def test_upload_ntriples_file(mem_repo: AsyncRdf4JRepository):
     assert result_list[0]["s"] == IRI("http://example.org/subject1")
 
 
-@pytest.mark.asyncio
 async def test_upload_nquads_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading an N-Quads file to the repository."""
     # Upload the sample N-Quads file
@@ -64,7 +63,6 @@ async def test_upload_nquads_file(mem_repo: AsyncRdf4JRepository):
     assert len(result_list) == 2
 
 
-@pytest.mark.asyncio
 async def test_upload_file_with_context(mem_repo: AsyncRdf4JRepository):
     """Test uploading a file with a specified context."""
     # Upload the sample file to a specific context
@@ -81,12 +79,10 @@ async def test_upload_file_with_context(mem_repo: AsyncRdf4JRepository):
         }
     """)
     assert isinstance(result, QuerySolutions)
-    result_list = list(result)
-    assert len(result_list) == 1
-    assert result_list[0]["s"] == IRI("http://example.org/subject1")
+    (solution,) = result
+    assert solution["s"] == IRI("http://example.org/subject1")
 
 
-@pytest.mark.asyncio
 async def test_upload_file_with_explicit_format(mem_repo: AsyncRdf4JRepository):
     """Test uploading a file with explicitly specified format."""
     # Upload a .txt file with explicit N-Triples format
@@ -96,11 +92,9 @@ async def test_upload_file_with_explicit_format(mem_repo: AsyncRdf4JRepository):
     # Verify the data was uploaded
     result = await mem_repo.query("SELECT * WHERE { ?s ?p ?o }")
     assert isinstance(result, QuerySolutions)
-    result_list = list(result)
-    assert len(result_list) == 1
+    (_,) = result
 
 
-@pytest.mark.asyncio
 async def test_upload_file_with_base_uri(mem_repo: AsyncRdf4JRepository):
     """Test uploading a file with a specified base URI."""
     # Upload a file with relative URIs using a base URI
@@ -119,14 +113,12 @@ async def test_upload_file_with_base_uri(mem_repo: AsyncRdf4JRepository):
     assert len(alice_subjects) == 2
 
 
-@pytest.mark.asyncio
 async def test_upload_nonexistent_file(mem_repo: AsyncRdf4JRepository):
     """Test that uploading a non-existent file raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError):
         await mem_repo.upload_file("/nonexistent/path/file.ttl")
 
 
-@pytest.mark.asyncio
 async def test_upload_invalid_rdf_file(mem_repo: AsyncRdf4JRepository):
     """Test that uploading an invalid RDF file raises SyntaxError."""
     # Upload a file with invalid RDF content
@@ -135,7 +127,6 @@ async def test_upload_invalid_rdf_file(mem_repo: AsyncRdf4JRepository):
         await mem_repo.upload_file(str(sample_file))
 
 
-@pytest.mark.asyncio
 async def test_upload_rdf_xml_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading an RDF/XML file to the repository."""
     # Upload the sample RDF/XML file
@@ -145,12 +136,10 @@ async def test_upload_rdf_xml_file(mem_repo: AsyncRdf4JRepository):
     # Verify the data was uploaded
     result = await mem_repo.query("SELECT * WHERE { ?s ?p ?o }")
     assert isinstance(result, QuerySolutions)
-    result_list = list(result)
-    assert len(result_list) == 1
-    assert result_list[0]["s"] == IRI("http://example.org/subject1")
+    (solution,) = result
+    assert solution["s"] == IRI("http://example.org/subject1")
 
 
-@pytest.mark.asyncio
 async def test_upload_jsonld_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading a JSON-LD file to the repository."""
     # Upload the sample JSON-LD file
@@ -166,7 +155,6 @@ async def test_upload_jsonld_file(mem_repo: AsyncRdf4JRepository):
     assert result_list[1]["s"] == IRI("http://example.org/subject2")
 
 
-@pytest.mark.asyncio
 async def test_upload_trig_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading a TriG file with multiple named graphs."""
     # Upload the sample TriG file
@@ -200,7 +188,6 @@ async def test_upload_trig_file(mem_repo: AsyncRdf4JRepository):
     assert result2_list[0]["s"] == IRI("http://example.org/subject2")
 
 
-@pytest.mark.asyncio
 async def test_upload_n3_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading an N3 file to the repository."""
     # Upload the sample N3 file
@@ -215,7 +202,6 @@ async def test_upload_n3_file(mem_repo: AsyncRdf4JRepository):
     assert result_list[0]["s"] == IRI("http://example.org/subject1")
 
 
-@pytest.mark.asyncio
 async def test_upload_empty_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading an empty file (only comments)."""
     # Upload a file with only comments
@@ -229,7 +215,6 @@ async def test_upload_empty_file(mem_repo: AsyncRdf4JRepository):
     assert len(result_list) == 0
 
 
-@pytest.mark.asyncio
 async def test_upload_large_file(mem_repo: AsyncRdf4JRepository):
     """Test uploading a larger file with multiple statements."""
     # Upload a file with many statements
@@ -244,7 +229,6 @@ async def test_upload_large_file(mem_repo: AsyncRdf4JRepository):
     assert len(result_list) >= 30  # At least 30 triples
 
 
-@pytest.mark.asyncio
 async def test_upload_file_with_path_object(mem_repo: AsyncRdf4JRepository):
     """Test uploading a file using Path object instead of string."""
     # Upload using Path object
@@ -258,7 +242,6 @@ async def test_upload_file_with_path_object(mem_repo: AsyncRdf4JRepository):
     assert len(result_list) == 2
 
 
-@pytest.mark.asyncio
 async def test_upload_multiple_predicates(mem_repo: AsyncRdf4JRepository):
     """Test uploading a file with multiple predicates per subject."""
     # Upload file with multiple predicates
@@ -276,7 +259,6 @@ async def test_upload_multiple_predicates(mem_repo: AsyncRdf4JRepository):
     assert len(result_list) >= 5  # At least 5 different predicates
 
 
-@pytest.mark.asyncio
 async def test_upload_file_overrides_context(mem_repo: AsyncRdf4JRepository):
     """Test that context parameter overrides named graphs in file."""
     # Upload N-Quads file with context parameter
@@ -309,7 +291,6 @@ async def test_upload_file_overrides_context(mem_repo: AsyncRdf4JRepository):
     assert len(result_old_list) == 0
 
 
-@pytest.mark.asyncio
 async def test_upload_file_twice_accumulates(mem_repo: AsyncRdf4JRepository):
     """Test that uploading the same file twice accumulates data."""
     # Upload file first time
@@ -334,7 +315,6 @@ async def test_upload_file_twice_accumulates(mem_repo: AsyncRdf4JRepository):
     assert len(result2_list) == initial_count
 
 
-@pytest.mark.asyncio
 async def test_upload_different_files_to_same_graph(mem_repo: AsyncRdf4JRepository):
     """Test uploading multiple different files to the same named graph."""
     context = IRI("http://example.org/combined-graph")
@@ -361,7 +341,6 @@ async def test_upload_different_files_to_same_graph(mem_repo: AsyncRdf4JReposito
     assert len(result_list) >= 7
 
 
-@pytest.mark.asyncio
 async def test_upload_file_with_special_characters_in_path(
     mem_repo: AsyncRdf4JRepository,
 ):